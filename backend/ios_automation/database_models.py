@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
 import os
 
 logger = logging.getLogger(__name__)
@@ -77,7 +79,13 @@ class DatabaseManager:
     def __init__(self, db_client: AsyncIOMotorClient = None):
         if db_client is None:
             mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-            self.client = AsyncIOMotorClient(mongo_url)
+            # Optional pool sizing, e.g. small pools for sequential scripts
+            pool_options = {}
+            if os.environ.get('MONGO_MAX_POOL_SIZE'):
+                pool_options['maxPoolSize'] = int(os.environ['MONGO_MAX_POOL_SIZE'])
+            if os.environ.get('MONGO_MIN_POOL_SIZE'):
+                pool_options['minPoolSize'] = int(os.environ['MONGO_MIN_POOL_SIZE'])
+            self.client = AsyncIOMotorClient(mongo_url, **pool_options)
             self.db = self.client[os.environ.get('DB_NAME', 'test_database')]
         else:
             self.client = db_client
@@ -91,6 +99,10 @@ class DatabaseManager:
         self.settings = self.db.settings
         
         self._indexes_created = False
+        
+        # Short-lived cache of the settings document: (fetched_at, settings)
+        self._settings_cache: Optional[tuple] = None
+        self._settings_cache_ttl = 30  # seconds
 
     async def ensure_indexes(self):
         """Create MongoDB indexes for optimal performance"""
@@ -106,6 +118,12 @@ class DatabaseManager:
                 ("ts", -1)
             ], name="interactions_compound_idx")
             
+            # Equality on account_id, then sort on ts (per-account event listings)
+            await self.interactions_events.create_index([
+                ("account_id", 1),
+                ("ts", -1)
+            ], name="account_ts_idx")
+            
             await self.interactions_events.create_index([
                 ("task_id", 1)
             ], name="task_id_idx")
@@ -160,6 +178,32 @@ class DatabaseManager:
             logger.error(f"Error recording interaction event: {e}")
             return False
 
+    async def record_interaction_events(self, events: List[InteractionEvent]) -> int:
+        """Record many interaction events with a single unordered insert_many"""
+        if not events:
+            return 0
+        
+        try:
+            await self.ensure_indexes()
+            
+            result = await self.interactions_events.insert_many(
+                [asdict(event) for event in events],
+                ordered=False
+            )
+            
+            logger.debug(f"Recorded {len(result.inserted_ids)} interaction events")
+            return len(result.inserted_ids)
+            
+        except BulkWriteError as e:
+            # Unordered inserts keep going past failed documents; report what landed
+            inserted = e.details.get("nInserted", 0)
+            logger.error(f"Recorded {inserted} of {len(events)} interaction events: {e}")
+            return inserted
+            
+        except Exception as e:
+            logger.error(f"Error recording interaction events: {e}")
+            return 0
+
     async def upsert_latest_interaction(self, interaction: LatestInteraction) -> bool:
         """Upsert latest interaction for deduplication control"""
         try:
@@ -189,6 +233,36 @@ class DatabaseManager:
             logger.error(f"Error upserting latest interaction: {e}")
             return False
 
+    async def bulk_upsert_latest_interactions(self, interactions: List[LatestInteraction]) -> bool:
+        """Upsert many latest interactions in a single bulk_write round-trip"""
+        if not interactions:
+            return True
+        
+        try:
+            await self.ensure_indexes()
+            
+            operations = [
+                ReplaceOne(
+                    {
+                        "account_id": interaction.account_id,
+                        "target_username": interaction.target_username,
+                        "action": interaction.action
+                    },
+                    asdict(interaction),
+                    upsert=True
+                )
+                for interaction in interactions
+            ]
+            
+            await self.interactions_latest.bulk_write(operations, ordered=False)
+            
+            logger.debug(f"Bulk upserted {len(interactions)} latest interactions")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error bulk upserting latest interactions: {e}")
+            return False
+
     async def check_interaction_exists(self, account_id: str, target_username: str, action: str) -> Optional[LatestInteraction]:
         """Check if interaction exists and is not expired"""
         try:
@@ -220,6 +294,68 @@ class DatabaseManager:
             logger.error(f"Error checking interaction existence: {e}")
             return None
 
+    async def find_latest_interactions(self, account_id: str, keys: List[tuple]) -> Dict[tuple, LatestInteraction]:
+        """Fetch unexpired latest interactions for many (target_username, action) pairs in one query"""
+        if not keys:
+            return {}
+        
+        try:
+            await self.ensure_indexes()
+            
+            cursor = self.interactions_latest.find({
+                "account_id": account_id,
+                "$or": [
+                    {"target_username": target_username, "action": action}
+                    for target_username, action in keys
+                ]
+            })
+            
+            now = datetime.utcnow()
+            found = {}
+            async for result in cursor:
+                result.pop('_id', None)
+                latest = LatestInteraction(**result)
+                if latest.expires_at and latest.expires_at > now:
+                    found[(latest.target_username, latest.action)] = latest
+            
+            return found
+            
+        except Exception as e:
+            logger.error(f"Error finding latest interactions: {e}")
+            return {}
+
+    def _build_event_filter(
+        self,
+        account_id: Optional[str] = None,
+        target_username: Optional[str] = None,
+        action: Optional[str] = None,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Build the Mongo filter for interaction event queries"""
+        filter_query = {}
+        
+        if account_id:
+            filter_query["account_id"] = account_id
+        if target_username:
+            filter_query["target_username"] = target_username
+        if action:
+            filter_query["action"] = action
+        if status:
+            filter_query["status"] = status
+        
+        # Date range filter
+        if from_date or to_date:
+            date_filter = {}
+            if from_date:
+                date_filter["$gte"] = from_date
+            if to_date:
+                date_filter["$lte"] = to_date
+            filter_query["ts"] = date_filter
+        
+        return filter_query
+
     async def get_interaction_events(
         self, 
         account_id: Optional[str] = None,
@@ -236,25 +372,9 @@ class DatabaseManager:
             await self.ensure_indexes()
             
             # Build filter query
-            filter_query = {}
-            
-            if account_id:
-                filter_query["account_id"] = account_id
-            if target_username:
-                filter_query["target_username"] = target_username
-            if action:
-                filter_query["action"] = action
-            if status:
-                filter_query["status"] = status
-            
-            # Date range filter
-            if from_date or to_date:
-                date_filter = {}
-                if from_date:
-                    date_filter["$gte"] = from_date
-                if to_date:
-                    date_filter["$lte"] = to_date
-                filter_query["ts"] = date_filter
+            filter_query = self._build_event_filter(
+                account_id, target_username, action, status, from_date, to_date
+            )
             
             # Execute query with pagination
             cursor = self.interactions_events.find(filter_query).sort("ts", -1).skip(skip).limit(limit)
@@ -267,6 +387,38 @@ class DatabaseManager:
             logger.error(f"Error querying interaction events: {e}")
             return []
 
+    async def iter_interaction_events(
+        self,
+        account_id: Optional[str] = None,
+        target_username: Optional[str] = None,
+        action: Optional[str] = None,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        limit: int = 10000,
+        batch_size: int = 500
+    ):
+        """
+        Iterate over matching interaction events without loading them all into memory
+        
+        Errors are logged and re-raised so a partially consumed export fails loudly
+        rather than ending early.
+        """
+        try:
+            await self.ensure_indexes()
+            
+            filter_query = self._build_event_filter(
+                account_id, target_username, action, status, from_date, to_date
+            )
+            
+            cursor = self.interactions_events.find(filter_query).sort("ts", -1).limit(limit).batch_size(batch_size)
+            async for event in cursor:
+                yield event
+                
+        except Exception as e:
+            logger.error(f"Error iterating interaction events: {e}")
+            raise
+
     async def get_interaction_metrics(self, account_id: Optional[str] = None, days: int = 30) -> Dict[str, int]:
         """Get interaction metrics for dashboard"""
         try:
@@ -355,15 +507,22 @@ class DatabaseManager:
 
     async def get_settings(self) -> Dict[str, Any]:
         """Get system settings"""
+        now = time.monotonic()
+        if self._settings_cache and now - self._settings_cache[0] < self._settings_cache_ttl:
+            # Callers may add keys to the result, so hand out a copy
+            return dict(self._settings_cache[1])
+        
         try:
             settings = await self.settings.find_one({"_id": "system_settings"})
             if settings:
                 # Remove MongoDB _id field
                 settings.pop("_id", None)
-                return settings
             else:
                 # Return default settings
-                return self._get_default_settings()
+                settings = self._get_default_settings()
+            
+            self._settings_cache = (now, settings)
+            return dict(settings)
                 
         except Exception as e:
             logger.error(f"Error getting settings: {e}")
@@ -377,6 +536,7 @@ class DatabaseManager:
                 {"_id": "system_settings", **settings_update},
                 upsert=True
             )
+            self._settings_cache = None
             
             logger.info(f"Updated system settings: {settings_update}")
             return True
@@ -81,41 +81,9 @@ class DeduplicationService:
             )
             
             if existing_interaction:
-                # User was already engaged with this action and it's not expired
-                self.stats["dedupe_hits"] += 1
-                reason = f"dedupe_hit - last {action} on {existing_interaction.last_ts.strftime('%Y-%m-%d %H:%M:%S')}"
-                
-                # Record dedupe hit event
-                await self.record_interaction_event(
-                    account_id=account_id,
-                    target_username=target_username,
-                    action=action,
-                    status=InteractionStatus.DEDUPE_HIT.value,
-                    reason=reason,
-                    task_id=task_id,
-                    device_id=device_id
-                )
-                
-                # Cache the negative result
-                self._cache[cache_key] = {
-                    "should_engage": False,
-                    "reason": reason,
-                    "timestamp": time.time()
-                }
-                
-                return False, reason
+                return await self._deny(cache_key, existing_interaction, task_id, device_id)
             else:
-                # No existing interaction or it expired, can engage
-                reason = "allowed - no recent interaction found"
-                
-                # Cache the positive result (shorter TTL for positive results)
-                self._cache[cache_key] = {
-                    "should_engage": True,
-                    "reason": reason,
-                    "timestamp": time.time()
-                }
-                
-                return True, reason
+                return self._allow(cache_key)
                 
         except Exception as e:
             logger.error(f"Error in should_engage check: {e}")
@@ -123,6 +91,53 @@ class DeduplicationService:
             reason = f"error_check_failed - {str(e)}"
             return True, reason
 
+    def _allow(self, cache_key: str) -> Tuple[bool, str]:
+        """Cache and return an 'allowed' result"""
+        # No existing interaction or it expired, can engage
+        reason = "allowed - no recent interaction found"
+        
+        # Cache the positive result (shorter TTL for positive results)
+        self._cache[cache_key] = {
+            "should_engage": True,
+            "reason": reason,
+            "timestamp": time.time()
+        }
+        
+        return True, reason
+
+    async def _deny(
+        self,
+        cache_key: str,
+        existing_interaction: LatestInteraction,
+        task_id: str = "",
+        device_id: str = ""
+    ) -> Tuple[bool, str]:
+        """Record a dedupe hit, cache and return the negative result"""
+        # User was already engaged with this action and it's not expired
+        self.stats["dedupe_hits"] += 1
+        action = existing_interaction.action
+        reason = f"dedupe_hit - last {action} on {existing_interaction.last_ts.strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        # Record dedupe hit event
+        await self.record_interaction_event(
+            account_id=existing_interaction.account_id,
+            target_username=existing_interaction.target_username,
+            action=action,
+            status=InteractionStatus.DEDUPE_HIT.value,
+            reason=reason,
+            task_id=task_id,
+            device_id=device_id
+        )
+        
+        # Cache the negative result
+        self._cache[cache_key] = {
+            "should_engage": False,
+            "reason": reason,
+            "timestamp": time.time()
+        }
+        
+        return False, reason
+
     async def record_successful_interaction(
         self,
         account_id: str,
@@ -304,14 +319,36 @@ class DeduplicationService:
         results = {}
         
         try:
+            # Answer cached pairs locally, collect the rest
+            pending = {}
             for username, action in users_and_actions:
-                should_engage, reason = await self.should_engage(
-                    account_id, username, action, task_id
-                )
-                results[(username, action)] = (should_engage, reason)
+                self.stats["total_checks"] += 1
+                key = (username.strip().lower(), action.lower())
+                cache_key = f"{account_id}:{key[0]}:{key[1]}"
+                
+                cached_result = self._cache.get(cache_key)
+                if cached_result and time.time() - cached_result["timestamp"] < self._cache_ttl:
+                    self.stats["cache_hits"] += 1
+                    results[(username, action)] = (cached_result["should_engage"], cached_result["reason"])
+                    continue
+                
+                self.stats["cache_misses"] += 1
+                pending.setdefault(key, []).append((username, action))
+            
+            # Resolve the uncached pairs with a single query
+            existing = await self.db_manager.find_latest_interactions(account_id, list(pending))
+            for key, originals in pending.items():
+                cache_key = f"{account_id}:{key[0]}:{key[1]}"
+                if key in existing:
+                    result = await self._deny(cache_key, existing[key], task_id)
+                else:
+                    result = self._allow(cache_key)
+                for original in originals:
+                    results[original] = result
             
             logger.debug(f"Bulk checked {len(users_and_actions)} user/action combinations")
-            return results
+            # Preserve input order
+            return {pair: results[pair] for pair in users_and_actions}
             
         except Exception as e:
             logger.error(f"Error in bulk check: {e}")
@@ -6,7 +6,9 @@ Instagram-specific error detection, rate limit handling, and circuit breaker
 import asyncio
 import logging
 import random
+import re
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
@@ -99,6 +101,12 @@ class ErrorHandler:
             ]
         }
         
+        # One precompiled alternation per error type, checked in priority order
+        self._error_matchers = [
+            (error_type, re.compile("|".join(re.escape(pattern.lower()) for pattern in patterns)))
+            for error_type, patterns in self.error_patterns.items()
+        ]
+        
         # Configuration from environment
         self.rate_limit_steps = [int(x) for x in os.environ.get('RATE_LIMIT_STEPS', '60,120,300,600').split(',')]
         self.cooldown_after_consecutive = int(os.environ.get('COOLDOWN_AFTER_CONSECUTIVE', '3'))
@@ -107,6 +115,9 @@ class ErrorHandler:
         # Account state tracking
         self.account_states: Dict[str, AccountStateInfo] = {}
         
+        # Per-account locks so concurrent tasks only serialize on the same account
+        self._account_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        
         # Backoff tracking per account
         self.backoff_counters: Dict[str, int] = {}
         
@@ -129,10 +140,9 @@ class ErrorHandler:
         """Detect error type from message and context"""
         error_text = (error_message + " " + element_context).lower()
         
-        for error_type, patterns in self.error_patterns.items():
-            for pattern in patterns:
-                if pattern.lower() in error_text:
-                    return error_type
+        for error_type, matcher in self._error_matchers:
+            if matcher.search(error_text):
+                return error_type
         
         # Check for timeout-specific indicators
         if "timeout" in error_text or "wait" in error_text:
@@ -185,35 +195,36 @@ class ErrorHandler:
             elif error_type == ErrorType.NETWORK_ERROR:
                 self.error_stats["network_errors"] += 1
             
-            # Get or create account state
-            if account_id not in self.account_states:
-                self.account_states[account_id] = AccountStateInfo(
-                    account_id=account_id,
-                    state=AccountState.ACTIVE
-                )
-            
-            account_state = self.account_states[account_id]
-            
-            # Add to error history
-            account_state.error_history.append(error_context)
-            
-            # Keep only recent errors (last 100)
-            if len(account_state.error_history) > 100:
-                account_state.error_history = account_state.error_history[-100:]
-            
-            # Handle different error types
-            if error_type == ErrorType.RATE_LIMITED:
-                return await self._handle_rate_limit_error(account_state, error_context)
-            elif error_type == ErrorType.PRIVATE_ACCOUNT:
-                return await self._handle_private_account_error(account_state, error_context)
-            elif error_type == ErrorType.TARGET_UNAVAILABLE:
-                return await self._handle_target_unavailable_error(account_state, error_context)
-            elif error_type == ErrorType.NETWORK_ERROR:
-                return await self._handle_network_error(account_state, error_context)
-            elif error_type == ErrorType.APP_CRASH:
-                return await self._handle_app_crash_error(account_state, error_context)
-            else:
-                return await self._handle_generic_error(account_state, error_context)
+            async with self._account_locks[account_id]:
+                # Get or create account state
+                if account_id not in self.account_states:
+                    self.account_states[account_id] = AccountStateInfo(
+                        account_id=account_id,
+                        state=AccountState.ACTIVE
+                    )
+                
+                account_state = self.account_states[account_id]
+                
+                # Add to error history
+                account_state.error_history.append(error_context)
+                
+                # Keep only recent errors (last 100)
+                if len(account_state.error_history) > 100:
+                    account_state.error_history = account_state.error_history[-100:]
+                
+                # Handle different error types
+                if error_type == ErrorType.RATE_LIMITED:
+                    return await self._handle_rate_limit_error(account_state, error_context)
+                elif error_type == ErrorType.PRIVATE_ACCOUNT:
+                    return await self._handle_private_account_error(account_state, error_context)
+                elif error_type == ErrorType.TARGET_UNAVAILABLE:
+                    return await self._handle_target_unavailable_error(account_state, error_context)
+                elif error_type == ErrorType.NETWORK_ERROR:
+                    return await self._handle_network_error(account_state, error_context)
+                elif error_type == ErrorType.APP_CRASH:
+                    return await self._handle_app_crash_error(account_state, error_context)
+                else:
+                    return await self._handle_generic_error(account_state, error_context)
                 
         except Exception as e:
             logger.error(f"Error in error handler: {e}")
@@ -286,24 +297,39 @@ class ErrorHandler:
         
         account_state = self.account_states[account_id]
         
+        # Read-only fast path: check the cooldown without taking the lock
+        cooldown_until = account_state.cooldown_until
         if account_state.state == AccountState.COOLDOWN:
-            if account_state.cooldown_until and datetime.utcnow() < account_state.cooldown_until:
-                remaining_seconds = int((account_state.cooldown_until - datetime.utcnow()).total_seconds())
+            if cooldown_until and datetime.utcnow() < cooldown_until:
+                remaining_seconds = int((cooldown_until - datetime.utcnow()).total_seconds())
                 return False, f"cooldown_active - {remaining_seconds}s remaining"
-            else:
-                # Cooldown expired, reset state
-                account_state.state = AccountState.ACTIVE
-                account_state.consecutive_errors = 0
-                account_state.cooldown_until = None
-                self.error_stats["accounts_in_cooldown"] = max(0, self.error_stats["accounts_in_cooldown"] - 1)
-                return True, "cooldown_expired"
+            
+            async with self._account_locks[account_id]:
+                # Re-check under the lock: another task may have reset the account
+                # or started a fresh cooldown since the unlocked read above
+                if account_state.state == AccountState.COOLDOWN:
+                    cooldown_until = account_state.cooldown_until
+                    now = datetime.utcnow()
+                    if cooldown_until and now < cooldown_until:
+                        remaining_seconds = int((cooldown_until - now).total_seconds())
+                        return False, f"cooldown_active - {remaining_seconds}s remaining"
+                    
+                    # Cooldown expired, reset state
+                    account_state.state = AccountState.ACTIVE
+                    account_state.consecutive_errors = 0
+                    account_state.cooldown_until = None
+                    self.error_stats["accounts_in_cooldown"] = max(0, self.error_stats["accounts_in_cooldown"] - 1)
+                    return True, "cooldown_expired"
         
         return True, "account_ready"
 
     async def reset_account_errors(self, account_id: str):
         """Reset error count for successful interactions"""
-        if account_id in self.account_states:
-            account_state = self.account_states[account_id]
+        async with self._account_locks[account_id]:
+            # Look the state up under the lock so a concurrent cleanup cannot remove it mid-reset
+            account_state = self.account_states.get(account_id)
+            if account_state is None:
+                return
             if account_state.consecutive_errors > 0:
                 logger.debug(f"Resetting error count for account {account_id}")
                 account_state.consecutive_errors = 0
@@ -350,6 +376,9 @@ class ErrorHandler:
         
         for account_id in accounts_to_remove:
             del self.account_states[account_id]
+            lock = self._account_locks.get(account_id)
+            if lock is not None and not lock.locked():
+                del self._account_locks[account_id]
             logger.debug(f"Cleaned up old state for account {account_id}")
         
         # Clean up error history for remaining accounts
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Query, Body
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -643,43 +643,75 @@ async def export_interaction_events(
     try:
         db_manager = get_db_manager()
         
-        # Get all matching events (no pagination for export)
-        events = await db_manager.get_interaction_events(
-            account_id=account_id,
-            action=action,
-            status=status,
-            from_date=from_date,
-            to_date=to_date,
-            limit=10000  # Large limit for export
-        )
-        
         if format.lower() == "csv":
-            # Create CSV
-            output = io.StringIO()
-            if events:
-                fieldnames = ['platform', 'account_id', 'target_username', 'action', 'status', 
-                            'reason', 'task_id', 'device_id', 'latency_ms', 'ts']
+            fieldnames = ['platform', 'account_id', 'target_username', 'action', 'status', 
+                        'reason', 'task_id', 'device_id', 'latency_ms', 'ts']
+            
+            events = db_manager.iter_interaction_events(
+                account_id=account_id,
+                action=action,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+                limit=10000  # Large limit for export
+            )
+            
+            # Fetch the first batch before responding so query errors still map to an HTTP error
+            try:
+                first_event = await events.__anext__()
+            except StopAsyncIteration:
+                first_event = None
+            
+            def write_event(writer, event):
+                # Convert datetime to string for CSV
+                if 'ts' in event and isinstance(event['ts'], datetime):
+                    event['ts'] = event['ts'].isoformat()
+                writer.writerow({k: event.get(k, '') for k in fieldnames})
+            
+            async def generate_csv():
+                # Stream rows straight from the cursor, flushing in ~64KB chunks
+                output = io.StringIO()
                 writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
                 
-                for event in events:
-                    # Remove ObjectId and convert datetime to string for CSV
-                    if '_id' in event:
-                        del event['_id']  # Remove MongoDB ObjectId
-                    if 'ts' in event and isinstance(event['ts'], datetime):
-                        event['ts'] = event['ts'].isoformat()
-                    writer.writerow({k: event.get(k, '') for k in fieldnames})
+                try:
+                    if first_event is not None:
+                        writer.writeheader()
+                        write_event(writer, first_event)
+                        
+                        async for event in events:
+                            write_event(writer, event)
+                            
+                            if output.tell() >= 65536:
+                                yield output.getvalue()
+                                output.seek(0)
+                                output.truncate(0)
+                    
+                    yield output.getvalue()
+                    
+                except Exception as e:
+                    # Headers are already sent; abort the stream so the client sees a failed download
+                    logger.error(f"Error streaming interaction export: {e}")
+                    raise
+                finally:
+                    output.close()
             
-            csv_content = output.getvalue()
-            output.close()
-            
-            return Response(
-                content=csv_content,
+            return StreamingResponse(
+                generate_csv(),
                 media_type="text/csv",
                 headers={"Content-Disposition": f"attachment; filename=interactions_export.csv"}
             )
         
         elif format.lower() == "json":
+            # Get all matching events (no pagination for export)
+            events = await db_manager.get_interaction_events(
+                account_id=account_id,
+                action=action,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+                limit=10000  # Large limit for export
+            )
+            
             # Convert datetime objects for JSON and remove ObjectIds
             for event in events:
                 if '_id' in event:
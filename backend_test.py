@@ -4,21 +4,109 @@ Backend Test Suite for Phase 1-3: Per-Device Task Queues + Workflow Cloning
 Tests all Phase 1-3 backend features including workflow templates, device queues, and safe mode execution
 """
 
-import asyncio
+import functools
+import io
 import json
 import os
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, NamedTuple
 import requests
-import uuid
+from requests.adapters import HTTPAdapter
+
+from backend_test_utils import ConcurrentSuiteRunner, orjson, parse_json
 
 # Get backend URL from environment
 BACKEND_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://4ef408ef-8dbe-4893-ba4f-68a32b4f29f2.preview.emergentagent.com')
 API_BASE_URL = f"{BACKEND_URL}/api"
 
-class Phase13BackendTester:
+# Fixed request payloads, built once at import time
+ENGAGEMENT_TEMPLATE = {
+    "name": "Test Engagement Workflow",
+    "description": "Test engagement workflow for automated testing",
+    "template_type": "engagement",
+    "target_pages": ["testpage1", "testpage2", "testpage3"],
+    "comment_list": ["Great post!", "Nice content!", "Love this!"],
+    "actions": {"follow": True, "like": True, "comment": False},
+    "max_users_per_page": 15,
+    "profile_validation": {"public_only": True, "min_posts": 3},
+    "skip_rate": 0.2,
+    "priority": "normal"
+}
+
+SINGLE_USER_TEMPLATE = {
+    "name": "Test Single User Workflow",
+    "description": "Test single user workflow for automated testing",
+    "template_type": "single_user",
+    "target_username": "testuser123",
+    "actions": {"follow": True, "like": True, "comment": False},
+    "max_likes": 5,
+    "max_follows": 1,
+    "priority": "high"
+}
+
+INVALID_ENGAGEMENT_TEMPLATE = {
+    "name": "Invalid Template",
+    "template_type": "engagement",
+    "target_pages": [],  # Empty - should fail
+    "comment_list": []   # Empty - should fail
+}
+
+INCOMPLETE_TEMPLATE = {
+    "name": "",  # Empty name
+    "template_type": "engagement"
+    # Missing required fields
+}
+
+INVALID_DEVICE_TASK = {
+    "device_id": "",  # Empty device ID
+    "target_username": "testuser",
+    "actions": ["search_user"],
+    "max_likes": 1,
+    "max_follows": 0
+}
+
+# Test names grouped by report category
+TEST_CATEGORIES = {
+    "Workflow Templates": ["List Workflow Templates", "Create Engagement Template", "Create Single User Template", 
+                         "Get Workflow Template", "Template Validation", "Delete Workflow Template"],
+    "Workflow Deployment": ["Deploy Workflow", "Deploy Invalid Template", "Deploy Empty Device List"],
+    "Device Queues": ["Get Device Queue", "Get All Device Queues", "Create Device-Bound Task", "Queue Pacing Stats"],
+    "Safe Mode": ["Safe Mode Status", "Dashboard Safe Mode", "Mock Task Execution"],
+    "Feature Flags": ["Feature Flags", "Pooled Assignment Default"],
+    "Database": ["Database Persistence", "Device Pacing State", "Device Tasks Collection"],
+    "Error Handling": ["Invalid Template ID", "Missing Required Fields", "Invalid Device ID"]
+}
+CATEGORY_OF_TEST = {name: category for category, names in TEST_CATEGORIES.items() for name in names}
+
+@functools.lru_cache(maxsize=512)
+def format_result_line(test_name: str, text: str) -> str:
+    """Format one report line; repeated (name, text) pairs are served from cache"""
+    return f"  - {test_name}: {text}\n"
+
+class ResultRecord(NamedTuple):
+    """A single logged test result"""
+    test_name: str
+    success: bool
+    details: str
+    error: str
+    ts: float  # wall-clock seconds, derived from a monotonic offset
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Report representation, with the timestamp rendered as ISO 8601"""
+        return {
+            "test_name": self.test_name,
+            "success": self.success,
+            "details": self.details,
+            "error": self.error,
+            "timestamp": datetime.utcfromtimestamp(self.ts).isoformat()
+        }
+
+class Phase13BackendTester(ConcurrentSuiteRunner):
     """Comprehensive tester for Phase 1-3 backend features"""
     
     def __init__(self):
@@ -26,6 +114,26 @@ class Phase13BackendTester:
         self.created_templates = []
         self.created_tasks = []
         
+        # Results are stamped with a monotonic offset; wall-clock ISO strings
+        # are only derived when the report is serialized
+        self._wall_t0 = time.time()
+        self._t0 = time.monotonic_ns()
+        
+        # Shared keep-alive connection pool for all suites
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Per-thread result buffers used while suites run concurrently
+        self._local = threading.local()
+        
+        # Running tallies maintained as results are logged
+        self._tally_lock = threading.Lock()
+        self._passed = 0
+        self._failed = 0
+        self._failures = []
+        
         # Test data
         self.mock_devices = [
             "mock_device_001",
@@ -35,54 +143,50 @@ class Phase13BackendTester:
         
     def log_test_result(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test result"""
-        result = {
-            "test_name": test_name,
-            "success": success,
-            "details": details,
-            "error": error,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        self.test_results.append(result)
+        result = ResultRecord(
+            test_name, success, details, error,
+            self._wall_t0 + (time.monotonic_ns() - self._t0) / 1e9
+        )
+        getattr(self._local, 'results', self.test_results).append(result)
+        with self._tally_lock:
+            if success:
+                self._passed += 1
+            else:
+                self._failed += 1
+                self._failures.append(result)
         
         status = "✅" if success else "❌"
         print(f"{status} {test_name}: {details if success else error}")
     
+    @contextmanager
+    def step(self, test_name: str):
+        """Run one subtest, logging any unexpected exception as its failure"""
+        try:
+            yield
+        except Exception as e:
+            self.log_test_result(test_name, False, error=str(e))
+    
     def test_workflow_templates_api(self):
         """Test workflow template CRUD operations"""
         print("\n📋 Testing Workflow Templates API...")
         
         # Test 1: List workflow templates (empty initially)
-        try:
-            response = requests.get(f"{API_BASE_URL}/workflows", timeout=10)
+        with self.step("List Workflow Templates"):
+            response = self.session.get(f"{API_BASE_URL}/workflows", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and isinstance(data.get('templates'), list):
                     self.log_test_result("List Workflow Templates", True, f"Retrieved {data.get('total_count', 0)} templates")
                 else:
                     self.log_test_result("List Workflow Templates", False, error="Invalid response format")
             else:
                 self.log_test_result("List Workflow Templates", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("List Workflow Templates", False, error=str(e))
         
         # Test 2: Create engagement workflow template
-        try:
-            engagement_template = {
-                "name": "Test Engagement Workflow",
-                "description": "Test engagement workflow for automated testing",
-                "template_type": "engagement",
-                "target_pages": ["testpage1", "testpage2", "testpage3"],
-                "comment_list": ["Great post!", "Nice content!", "Love this!"],
-                "actions": {"follow": True, "like": True, "comment": False},
-                "max_users_per_page": 15,
-                "profile_validation": {"public_only": True, "min_posts": 3},
-                "skip_rate": 0.2,
-                "priority": "normal"
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/workflows", json=engagement_template, timeout=10)
+        with self.step("Create Engagement Template"):
+            response = self.session.post(f"{API_BASE_URL}/workflows", json=ENGAGEMENT_TEMPLATE, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and data.get('template_id'):
                     template_id = data['template_id']
                     self.created_templates.append(template_id)
@@ -91,25 +195,12 @@ class Phase13BackendTester:
                     self.log_test_result("Create Engagement Template", False, error="No template ID returned")
             else:
                 self.log_test_result("Create Engagement Template", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Create Engagement Template", False, error=str(e))
         
         # Test 3: Create single user workflow template
-        try:
-            single_user_template = {
-                "name": "Test Single User Workflow",
-                "description": "Test single user workflow for automated testing",
-                "template_type": "single_user",
-                "target_username": "testuser123",
-                "actions": {"follow": True, "like": True, "comment": False},
-                "max_likes": 5,
-                "max_follows": 1,
-                "priority": "high"
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/workflows", json=single_user_template, timeout=10)
+        with self.step("Create Single User Template"):
+            response = self.session.post(f"{API_BASE_URL}/workflows", json=SINGLE_USER_TEMPLATE, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and data.get('template_id'):
                     template_id = data['template_id']
                     self.created_templates.append(template_id)
@@ -118,16 +209,14 @@ class Phase13BackendTester:
                     self.log_test_result("Create Single User Template", False, error="No template ID returned")
             else:
                 self.log_test_result("Create Single User Template", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Create Single User Template", False, error=str(e))
         
         # Test 4: Get specific workflow template
         if self.created_templates:
-            try:
+            with self.step("Get Workflow Template"):
                 template_id = self.created_templates[0]
-                response = requests.get(f"{API_BASE_URL}/workflows/{template_id}", timeout=10)
+                response = self.session.get(f"{API_BASE_URL}/workflows/{template_id}", timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json(response)
                     if data.get('success') and data.get('template'):
                         template = data['template']
                         self.log_test_result("Get Workflow Template", True, f"Retrieved template: {template.get('name')}")
@@ -135,33 +224,22 @@ class Phase13BackendTester:
                         self.log_test_result("Get Workflow Template", False, error="Invalid response format")
                 else:
                     self.log_test_result("Get Workflow Template", False, error=f"HTTP {response.status_code}")
-            except Exception as e:
-                self.log_test_result("Get Workflow Template", False, error=str(e))
         
         # Test 5: Test template validation (empty required fields)
-        try:
-            invalid_template = {
-                "name": "Invalid Template",
-                "template_type": "engagement",
-                "target_pages": [],  # Empty - should fail
-                "comment_list": []   # Empty - should fail
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/workflows", json=invalid_template, timeout=10)
+        with self.step("Template Validation"):
+            response = self.session.post(f"{API_BASE_URL}/workflows", json=INVALID_ENGAGEMENT_TEMPLATE, timeout=10)
             if response.status_code == 400 or response.status_code == 500:
                 self.log_test_result("Template Validation", True, "Invalid template correctly rejected")
             else:
                 self.log_test_result("Template Validation", False, error=f"Invalid template accepted: HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Template Validation", False, error=str(e))
         
         # Test 6: Delete workflow template
         if self.created_templates:
-            try:
+            with self.step("Delete Workflow Template"):
                 template_id = self.created_templates[-1]  # Delete last created
-                response = requests.delete(f"{API_BASE_URL}/workflows/{template_id}", timeout=10)
+                response = self.session.delete(f"{API_BASE_URL}/workflows/{template_id}", timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json(response)
                     if data.get('success'):
                         self.log_test_result("Delete Workflow Template", True, f"Deleted template: {template_id}")
                         self.created_templates.remove(template_id)
@@ -169,8 +247,6 @@ class Phase13BackendTester:
                         self.log_test_result("Delete Workflow Template", False, error="Deletion failed")
                 else:
                     self.log_test_result("Delete Workflow Template", False, error=f"HTTP {response.status_code}")
-            except Exception as e:
-                self.log_test_result("Delete Workflow Template", False, error=str(e))
     
     def test_workflow_deployment(self):
         """Test workflow deployment to multiple devices"""
@@ -181,7 +257,7 @@ class Phase13BackendTester:
             return
         
         # Test 1: Deploy workflow to multiple devices
-        try:
+        with self.step("Deploy Workflow"):
             template_id = self.created_templates[0]
             deployment_request = {
                 "device_ids": self.mock_devices,
@@ -191,9 +267,9 @@ class Phase13BackendTester:
                 }
             }
             
-            response = requests.post(f"{API_BASE_URL}/workflows/{template_id}/deploy", json=deployment_request, timeout=10)
+            response = self.session.post(f"{API_BASE_URL}/workflows/{template_id}/deploy", json=deployment_request, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success'):
                     deployment_summary = data.get('deployment_summary', {})
                     created_tasks = data.get('created_tasks', [])
@@ -208,49 +284,43 @@ class Phase13BackendTester:
                     self.log_test_result("Deploy Workflow", False, error="Deployment failed")
             else:
                 self.log_test_result("Deploy Workflow", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Deploy Workflow", False, error=str(e))
         
         # Test 2: Test deployment with invalid template ID
-        try:
+        with self.step("Deploy Invalid Template"):
             invalid_template_id = "invalid-template-id"
             deployment_request = {
                 "device_ids": ["mock_device_001"]
             }
             
-            response = requests.post(f"{API_BASE_URL}/workflows/{invalid_template_id}/deploy", json=deployment_request, timeout=10)
+            response = self.session.post(f"{API_BASE_URL}/workflows/{invalid_template_id}/deploy", json=deployment_request, timeout=10)
             if response.status_code == 404 or response.status_code == 500:
                 self.log_test_result("Deploy Invalid Template", True, "Invalid template ID correctly rejected")
             else:
                 self.log_test_result("Deploy Invalid Template", False, error=f"Invalid template accepted: HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Deploy Invalid Template", False, error=str(e))
         
         # Test 3: Test deployment with empty device list
-        try:
+        with self.step("Deploy Empty Device List"):
             template_id = self.created_templates[0]
             deployment_request = {
                 "device_ids": []  # Empty list should fail
             }
             
-            response = requests.post(f"{API_BASE_URL}/workflows/{template_id}/deploy", json=deployment_request, timeout=10)
+            response = self.session.post(f"{API_BASE_URL}/workflows/{template_id}/deploy", json=deployment_request, timeout=10)
             if response.status_code == 400 or response.status_code == 422:
                 self.log_test_result("Deploy Empty Device List", True, "Empty device list correctly rejected")
             else:
                 self.log_test_result("Deploy Empty Device List", False, error=f"Empty device list accepted: HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Deploy Empty Device List", False, error=str(e))
     
     def test_device_queues_api(self):
         """Test per-device queue management"""
         print("\n📱 Testing Device Queue Management...")
         
         # Test 1: Get device queue snapshot
-        try:
+        with self.step("Get Device Queue"):
             device_id = self.mock_devices[0]
-            response = requests.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
+            response = self.session.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'queue_snapshot' in data:
                     snapshot = data['queue_snapshot']
                     self.log_test_result("Get Device Queue", True, 
@@ -259,14 +329,12 @@ class Phase13BackendTester:
                     self.log_test_result("Get Device Queue", False, error="Invalid response format")
             else:
                 self.log_test_result("Get Device Queue", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Get Device Queue", False, error=str(e))
         
         # Test 2: Get all device queues
-        try:
-            response = requests.get(f"{API_BASE_URL}/devices/queues/all", timeout=10)
+        with self.step("Get All Device Queues"):
+            response = self.session.get(f"{API_BASE_URL}/devices/queues/all", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'device_queues' in data:
                     device_queues = data['device_queues']
                     statistics = data.get('statistics', {})
@@ -276,11 +344,9 @@ class Phase13BackendTester:
                     self.log_test_result("Get All Device Queues", False, error="Invalid response format")
             else:
                 self.log_test_result("Get All Device Queues", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Get All Device Queues", False, error=str(e))
         
         # Test 3: Create device-bound task
-        try:
+        with self.step("Create Device-Bound Task"):
             device_task = {
                 "device_id": self.mock_devices[1],
                 "target_username": "devicetest_user",
@@ -290,9 +356,9 @@ class Phase13BackendTester:
                 "priority": "normal"
             }
             
-            response = requests.post(f"{API_BASE_URL}/tasks/create-device-bound", json=device_task, timeout=10)
+            response = self.session.post(f"{API_BASE_URL}/tasks/create-device-bound", json=device_task, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and data.get('task_id'):
                     task_id = data['task_id']
                     self.created_tasks.append(task_id)
@@ -302,15 +368,13 @@ class Phase13BackendTester:
                     self.log_test_result("Create Device-Bound Task", False, error="No task ID returned")
             else:
                 self.log_test_result("Create Device-Bound Task", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Create Device-Bound Task", False, error=str(e))
         
         # Test 4: Verify queue position and pacing stats
-        try:
+        with self.step("Queue Pacing Stats"):
             device_id = self.mock_devices[1]
-            response = requests.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
+            response = self.session.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 snapshot = data.get('queue_snapshot', {})
                 pacing_stats = snapshot.get('pacing_stats', {})
                 
@@ -321,18 +385,16 @@ class Phase13BackendTester:
                     self.log_test_result("Queue Pacing Stats", False, error="Missing pacing statistics")
             else:
                 self.log_test_result("Queue Pacing Stats", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Queue Pacing Stats", False, error=str(e))
     
     def test_safe_mode_verification(self):
         """Test safe mode status and mock execution"""
         print("\n🛡️ Testing Safe Mode Verification...")
         
         # Test 1: Get safe mode status
-        try:
-            response = requests.get(f"{API_BASE_URL}/system/safe-mode", timeout=10)
+        with self.step("Safe Mode Status"):
+            response = self.session.get(f"{API_BASE_URL}/system/safe-mode", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'safe_mode_status' in data:
                     safe_mode_status = data['safe_mode_status']
                     if safe_mode_status.get('safe_mode') is True:
@@ -344,14 +406,12 @@ class Phase13BackendTester:
                     self.log_test_result("Safe Mode Status", False, error="Invalid response format")
             else:
                 self.log_test_result("Safe Mode Status", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Safe Mode Status", False, error=str(e))
         
         # Test 2: Verify safe mode in dashboard stats
-        try:
-            response = requests.get(f"{API_BASE_URL}/dashboard/stats", timeout=10)
+        with self.step("Dashboard Safe Mode"):
+            response = self.session.get(f"{API_BASE_URL}/dashboard/stats", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 safe_mode_status = data.get('safe_mode_status')
                 if safe_mode_status and safe_mode_status.get('safe_mode') is True:
                     self.log_test_result("Dashboard Safe Mode", True, "Safe mode status in dashboard")
@@ -359,23 +419,26 @@ class Phase13BackendTester:
                     self.log_test_result("Dashboard Safe Mode", False, error="Safe mode status not in dashboard")
             else:
                 self.log_test_result("Dashboard Safe Mode", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Dashboard Safe Mode", False, error=str(e))
         
         # Test 3: Verify mock task execution duration
         if self.created_tasks:
-            try:
-                # Wait a moment for mock execution to potentially complete
-                time.sleep(3)
-                
-                # Check if any tasks have completed with mock stats
+            with self.step("Mock Task Execution"):
+                # Poll the queue for up to 3s instead of sleeping a fixed 3s,
+                # stopping as soon as mock tasks report completions
                 device_id = self.mock_devices[0]
-                response = requests.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
+                deadline = time.monotonic() + 3
+                while True:
+                    response = self.session.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
+                    if response.status_code != 200:
+                        break
+                    data = parse_json(response)
                     snapshot = data.get('queue_snapshot', {})
                     statistics = snapshot.get('statistics', {})
-                    
+                    if statistics.get('total_tasks_completed', 0) > 0 or time.monotonic() >= deadline:
+                        break
+                    time.sleep(0.25)
+                
+                if response.status_code == 200:
                     if statistics.get('total_tasks_completed', 0) > 0:
                         self.log_test_result("Mock Task Execution", True, 
                             f"Mock tasks completed: {statistics.get('total_tasks_completed')}")
@@ -383,18 +446,16 @@ class Phase13BackendTester:
                         self.log_test_result("Mock Task Execution", True, "Mock execution system ready")
                 else:
                     self.log_test_result("Mock Task Execution", False, error=f"HTTP {response.status_code}")
-            except Exception as e:
-                self.log_test_result("Mock Task Execution", False, error=str(e))
     
     def test_feature_flags_integration(self):
         """Test feature flags and settings integration"""
         print("\n🏁 Testing Feature Flags Integration...")
         
         # Test 1: Get settings with feature flags
-        try:
-            response = requests.get(f"{API_BASE_URL}/settings", timeout=10)
+        with self.step("Feature Flags"):
+            response = self.session.get(f"{API_BASE_URL}/settings", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'settings' in data:
                     settings = data['settings']
                     feature_flags = settings.get('feature_flags', {})
@@ -415,14 +476,12 @@ class Phase13BackendTester:
                     self.log_test_result("Feature Flags", False, error="Invalid response format")
             else:
                 self.log_test_result("Feature Flags", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Feature Flags", False, error=str(e))
         
         # Test 2: Verify ENABLE_POOLED_ASSIGNMENT is false by default
-        try:
-            response = requests.get(f"{API_BASE_URL}/settings", timeout=10)
+        with self.step("Pooled Assignment Default"):
+            response = self.session.get(f"{API_BASE_URL}/settings", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 settings = data.get('settings', {})
                 feature_flags = settings.get('feature_flags', {})
                 
@@ -433,18 +492,16 @@ class Phase13BackendTester:
                     self.log_test_result("Pooled Assignment Default", False, error=f"ENABLE_POOLED_ASSIGNMENT is {pooled_assignment}, expected false")
             else:
                 self.log_test_result("Pooled Assignment Default", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Pooled Assignment Default", False, error=str(e))
     
     def test_database_integration(self):
         """Test database collections and data persistence"""
         print("\n🗄️ Testing Database Integration...")
         
         # Test 1: Verify workflow templates are persisted
-        try:
-            response = requests.get(f"{API_BASE_URL}/workflows", timeout=10)
+        with self.step("Database Persistence"):
+            response = self.session.get(f"{API_BASE_URL}/workflows", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 templates = data.get('templates', [])
                 
                 if len(templates) > 0:
@@ -461,14 +518,12 @@ class Phase13BackendTester:
                     self.log_test_result("Database Persistence", True, "Database accessible (empty)")
             else:
                 self.log_test_result("Database Persistence", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Database Persistence", False, error=str(e))
         
         # Test 2: Verify device pacing state tracking
-        try:
-            response = requests.get(f"{API_BASE_URL}/devices/queues/all", timeout=10)
+        with self.step("Device Pacing State"):
+            response = self.session.get(f"{API_BASE_URL}/devices/queues/all", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 device_queues = data.get('device_queues', {})
                 
                 # Check if mock devices have pacing state
@@ -486,18 +541,18 @@ class Phase13BackendTester:
                     self.log_test_result("Device Pacing State", False, error="Device pacing states not found")
             else:
                 self.log_test_result("Device Pacing State", False, error=f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Device Pacing State", False, error=str(e))
         
         # Test 3: Verify device tasks collection
         if self.created_tasks:
-            try:
+            with self.step("Device Tasks Collection"):
                 # Check if tasks are tracked in device queues
                 tasks_found = 0
-                for device_id in self.mock_devices:
-                    response = requests.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
+                responses = self.get_concurrently(
+                    [f"{API_BASE_URL}/devices/{device_id}/queue" for device_id in self.mock_devices]
+                )
+                for response in responses:
                     if response.status_code == 200:
-                        data = response.json()
+                        data = parse_json(response)
                         snapshot = data.get('queue_snapshot', {})
                         queue_tasks = snapshot.get('queue_tasks', [])
                         
@@ -509,111 +564,155 @@ class Phase13BackendTester:
                     self.log_test_result("Device Tasks Collection", True, f"Found {tasks_found} tasks in device queues")
                 else:
                     self.log_test_result("Device Tasks Collection", True, "Device tasks collection accessible")
-            except Exception as e:
-                self.log_test_result("Device Tasks Collection", False, error=str(e))
     
     def test_error_handling(self):
         """Test error handling and validation"""
         print("\n⚠️ Testing Error Handling...")
         
         # Test 1: Invalid workflow template ID
-        try:
-            response = requests.get(f"{API_BASE_URL}/workflows/invalid-id", timeout=10)
+        with self.step("Invalid Template ID"):
+            response = self.session.get(f"{API_BASE_URL}/workflows/invalid-id", timeout=10)
             if response.status_code == 404:
                 self.log_test_result("Invalid Template ID", True, "404 returned for invalid template ID")
             else:
                 self.log_test_result("Invalid Template ID", False, error=f"Expected 404, got {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Invalid Template ID", False, error=str(e))
         
         # Test 2: Missing required fields in template creation
-        try:
-            invalid_template = {
-                "name": "",  # Empty name
-                "template_type": "engagement"
-                # Missing required fields
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/workflows", json=invalid_template, timeout=10)
+        with self.step("Missing Required Fields"):
+            response = self.session.post(f"{API_BASE_URL}/workflows", json=INCOMPLETE_TEMPLATE, timeout=10)
             if response.status_code >= 400:
                 self.log_test_result("Missing Required Fields", True, "Invalid template correctly rejected")
             else:
                 self.log_test_result("Missing Required Fields", False, error=f"Invalid template accepted: HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Missing Required Fields", False, error=str(e))
         
         # Test 3: Invalid device ID in task creation
-        try:
-            invalid_task = {
-                "device_id": "",  # Empty device ID
-                "target_username": "testuser",
-                "actions": ["search_user"],
-                "max_likes": 1,
-                "max_follows": 0
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/tasks/create-device-bound", json=invalid_task, timeout=10)
+        with self.step("Invalid Device ID"):
+            response = self.session.post(f"{API_BASE_URL}/tasks/create-device-bound", json=INVALID_DEVICE_TASK, timeout=10)
             if response.status_code >= 400:
                 self.log_test_result("Invalid Device ID", True, "Invalid device ID correctly rejected")
             else:
                 self.log_test_result("Invalid Device ID", False, error=f"Invalid device ID accepted: HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test_result("Invalid Device ID", False, error=str(e))
     
-    def generate_test_report(self):
+    def backend_reachable(self, timeout: float = 2.0) -> bool:
+        """Fast preflight so a dead backend fails once instead of timing out per test"""
+        try:
+            self.session.head(f"{API_BASE_URL}/", timeout=timeout)
+            return True
+        except requests.RequestException as e:
+            self.log_test_result("Backend Reachability", False, error=f"Backend unreachable: {e}")
+            return False
+    
+    def get_concurrently(self, urls: List[str]) -> List[Any]:
+        """Issue independent GET probes in parallel, returning responses in request order"""
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(lambda url: self.session.get(url, timeout=10), urls))
+    
+    def generate_test_report(self, include_results: bool = True):
         """Generate comprehensive test report"""
-        print("\n📋 Phase 1-3 Per-Device Task Queues + Workflow Cloning Test Report")
-        print("=" * 80)
-        
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['success'])
-        failed_tests = total_tests - passed_tests
-        
-        print(f"Total Tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests*100):.1f}%")
+        # Passed tests are only listed when PHASE13_VERBOSE=1; failures always are
+        verbose = os.environ.get('PHASE13_VERBOSE') == '1'
+        
+        # Buffer the whole report and emit it with a single write
+        buf = io.StringIO()
+        w = buf.write
+        w("\n📋 Phase 1-3 Per-Device Task Queues + Workflow Cloning Test Report\n")
+        w("=" * 80 + "\n")
+        
+        # Single pass: partition passed results and tally per-category counts
+        passed = []
+        category_counts = {category: [0, 0] for category in TEST_CATEGORIES}
+        for result in self.test_results:
+            if verbose and result.success:
+                passed.append(result)
+            counts = category_counts.get(CATEGORY_OF_TEST.get(result.test_name))
+            if counts is not None:
+                counts[0] += result.success
+                counts[1] += 1
+        
+        passed_tests = self._passed
+        failed_tests = self._failed
+        total_tests = passed_tests + failed_tests
+        # passed_tests is 0 whenever total_tests is, so the rate is 0.0 then too
+        success_rate = 100.0 * passed_tests / (total_tests or 1)
+        
+        w(f"Total Tests: {total_tests}\n")
+        w(f"Passed: {passed_tests}\n")
+        w(f"Failed: {failed_tests}\n")
+        w(f"Success Rate: {success_rate:.1f}%\n")
         
         if failed_tests > 0:
-            print("\n❌ Failed Tests:")
-            for result in self.test_results:
-                if not result['success']:
-                    print(f"  - {result['test_name']}: {result['error']}")
+            w("\n❌ Failed Tests:\n")
+            w("".join(format_result_line(r.test_name, r.error) for r in self._failures))
         
-        print("\n✅ Passed Tests:")
-        for result in self.test_results:
-            if result['success']:
-                print(f"  - {result['test_name']}: {result['details']}")
+        if verbose:
+            w("\n✅ Passed Tests:\n")
+            w("".join(format_result_line(r.test_name, r.details) for r in passed))
         
         # Test summary by category
-        categories = {
-            "Workflow Templates": ["List Workflow Templates", "Create Engagement Template", "Create Single User Template", 
-                                 "Get Workflow Template", "Template Validation", "Delete Workflow Template"],
-            "Workflow Deployment": ["Deploy Workflow", "Deploy Invalid Template", "Deploy Empty Device List"],
-            "Device Queues": ["Get Device Queue", "Get All Device Queues", "Create Device-Bound Task", "Queue Pacing Stats"],
-            "Safe Mode": ["Safe Mode Status", "Dashboard Safe Mode", "Mock Task Execution"],
-            "Feature Flags": ["Feature Flags", "Pooled Assignment Default"],
-            "Database": ["Database Persistence", "Device Pacing State", "Device Tasks Collection"],
-            "Error Handling": ["Invalid Template ID", "Missing Required Fields", "Invalid Device ID"]
-        }
+        w("\n📊 Test Results by Category:\n")
+        for category, (category_passed, category_total) in category_counts.items():
+            if category_total:
+                w(f"  {category}: {category_passed}/{category_total} ({(category_passed/category_total*100):.0f}%)\n")
         
-        print("\n📊 Test Results by Category:")
-        for category, test_names in categories.items():
-            category_results = [r for r in self.test_results if r['test_name'] in test_names]
-            if category_results:
-                passed = sum(1 for r in category_results if r['success'])
-                total = len(category_results)
-                print(f"  {category}: {passed}/{total} ({(passed/total*100):.0f}%)")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
-        return {
+        report = {
             "total_tests": total_tests,
             "passed_tests": passed_tests,
             "failed_tests": failed_tests,
-            "success_rate": passed_tests/total_tests*100 if total_tests > 0 else 0,
-            "results": self.test_results,
-            "created_templates": self.created_templates,
-            "created_tasks": self.created_tasks
+            "success_rate": success_rate
         }
+        if include_results:
+            report["results"] = self.test_results
+            report["created_templates"] = self.created_templates
+            report["created_tasks"] = self.created_tasks
+        return report
+
+def save_report(report: Dict[str, Any], path: str):
+    """Write the report to disk atomically, streaming it one record at a time without orjson"""
+    # Compact JSON by default; set PHASE13_PRETTY_REPORT for an indented file
+    pretty = bool(os.environ.get('PHASE13_PRETTY_REPORT'))
+    
+    # Write alongside the target and rename over it, so an interrupted run
+    # never leaves a truncated report behind
+    tmp_path = f"{path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(report, default=ResultRecord.to_json,
+                                 option=orjson.OPT_INDENT_2 if pretty else 0))
+        os.replace(tmp_path, path)
+        return
+    
+    if pretty:
+        open_key, key_sep, item_sep, close = '{\n  ', ': ', ',\n  ', '\n}\n'
+        record_sep, records_close = ',\n    ', '\n  ]'
+        separators = (', ', ': ')
+    else:
+        open_key, key_sep, item_sep, close = '{', ':', ',', '}'
+        record_sep, records_close = ',', ']'
+        separators = (',', ':')
+    
+    # One shared encoder; iterencode yields chunks straight into the file
+    # instead of building each serialized value in memory
+    encoder = json.JSONEncoder(separators=separators)
+    
+    with open(tmp_path, 'w') as f:
+        f.write(open_key)
+        for index, (key, value) in enumerate(report.items()):
+            if index:
+                f.write(item_sep)
+            f.write(json.dumps(key) + key_sep)
+            if key == 'results':
+                f.write('[')
+                for record_index, record in enumerate(value):
+                    f.write(record_sep if record_index else record_sep[1:])
+                    f.writelines(encoder.iterencode(record.to_json()))
+                f.write(records_close if value else ']')
+            else:
+                f.writelines(encoder.iterencode(value))
+        f.write(close)
+    os.replace(tmp_path, path)
 
 def main():
     """Main test execution function"""
@@ -623,26 +722,38 @@ def main():
     tester = Phase13BackendTester()
     
     try:
-        # Run all test suites
-        tester.test_workflow_templates_api()
-        tester.test_workflow_deployment()
-        tester.test_device_queues_api()
-        tester.test_safe_mode_verification()
-        tester.test_feature_flags_integration()
-        tester.test_database_integration()
-        tester.test_error_handling()
+        if not tester.backend_reachable():
+            raise RuntimeError(f"backend at {API_BASE_URL} is not reachable, skipping test suites")
+        
+        # Run all test suites. Suites within a stage are independent; later
+        # stages rely on the templates and tasks created by earlier ones.
+        tester.run_suites_concurrently([
+            tester.test_workflow_templates_api,
+            tester.test_device_queues_api,
+            tester.test_feature_flags_integration,
+            tester.test_error_handling,
+        ])
+        tester.run_suites_concurrently([
+            tester.test_workflow_deployment,
+        ])
+        tester.run_suites_concurrently([
+            tester.test_safe_mode_verification,
+            tester.test_database_integration,
+        ])
         
     except Exception as e:
         print(f"❌ Test execution failed: {e}")
     
+    # PHASE13_NO_REPORT skips the report file when only the exit code matters
+    write_report = not os.environ.get('PHASE13_NO_REPORT')
+    
     # Generate and return report
-    report = tester.generate_test_report()
+    report = tester.generate_test_report(include_results=write_report)
     
     # Save detailed report to file
-    with open('/app/phase13_workflow_test_report.json', 'w') as f:
-        json.dump(report, f, indent=2, default=str)
-    
-    print(f"\n📄 Detailed test report saved to: /app/phase13_workflow_test_report.json")
+    if write_report:
+        save_report(report, '/app/phase13_workflow_test_report.json')
+        print(f"\n📄 Detailed test report saved to: /app/phase13_workflow_test_report.json")
     
     return report
 
@@ -650,10 +761,13 @@ if __name__ == "__main__":
     # Run the test suite
     report = main()
     
-    # Exit with appropriate code
-    if report['failed_tests'] > 0:
-        print(f"\n❌ Testing completed with {report['failed_tests']} failures")
-        sys.exit(1)
+    # Exit with appropriate code, emitting the summary as a single write
+    failed_tests = report['failed_tests']
+    if failed_tests > 0:
+        summary = f"\n❌ Testing completed with {failed_tests} failures\n"
     else:
-        print(f"\n✅ All {report['passed_tests']} tests passed successfully!")
-        sys.exit(0)
\ No newline at end of file
+        summary = f"\n✅ All {report['passed_tests']} tests passed successfully!\n"
+    sys.stdout.flush()
+    sys.stdout.buffer.write(summary.encode())
+    sys.stdout.buffer.flush()
+    sys.exit(1 if failed_tests > 0 else 0)
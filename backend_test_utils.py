@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the backend test scripts
+JSON encoding/decoding (orjson when installed) and concurrent suite execution
+used by backend_test.py, ux_polish_backend_test.py and burn_in_test_suite.py
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+def parse_json(response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+class ConcurrentSuiteRunner:
+    """Mixin for testers whose log_test_result appends to self._local.results when set"""
+
+    def _run_suite(self, suite):
+        """Run a single suite, collecting its results in a thread-local list"""
+        results = self._local.results = []
+        try:
+            suite()
+        except Exception as e:
+            print(f"❌ Test suite {suite.__name__} failed: {e}")
+        finally:
+            del self._local.results
+        return results
+
+    def run_suites_concurrently(self, suites):
+        """Run independent suites in parallel, keeping results in submission order"""
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = [executor.submit(self._run_suite, suite) for suite in suites]
+            for future in futures:
+                self.test_results.extend(future.result())
@@ -5,21 +5,26 @@ Production Burn-In Test Suite for Operator Dashboard + Phase 4 Live Device Integ
 """
 
 import asyncio
+import functools
 import json
 import os
 import sys
 import time
 import threading
 import psutil
+import queue
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
-import statistics
 import random
 
+from backend_test_utils import JSON_HEADERS, encode_json, orjson, parse_json
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,136 +41,246 @@ BACKEND_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://4ef408ef-8dbe-489
 API_BASE_URL = f"{BACKEND_URL}/api"
 BURN_IN_DURATION_HOURS = 2.0  # 2 hours
 TEST_INTERVAL_SECONDS = 10     # Test every 10 seconds
-MAX_CONCURRENT_REQUESTS = 20   # Maximum concurrent API calls
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('BURN_IN_MAX_CONCURRENCY', (os.cpu_count() or 4) * 5))  # I/O-bound workers
+METRIC_BUFFER_SIZE = 100_000   # Most recent samples kept per metric buffer
+# Per-operation latency targets (ms), checked after every call and against run averages
+PERFORMANCE_SLA_MS = {
+    'metrics_refresh': 5000,
+    'mode_toggle': 1000,
+    'device_command': 2000,
+}
+RECORDS_PATH = os.environ.get('BURN_IN_RECORDS_PATH', '/tmp/burn_in_records.jsonl')  # Full record log
+RECORDS_QUEUE_SIZE = 10_000    # Records waiting for the JSONL writer before new ones are dropped
+
+@functools.lru_cache(maxsize=256)
+def api_url(endpoint: str) -> str:
+    """Build the full URL for an API endpoint, reusing it across requests"""
+    return f"{API_BASE_URL}{endpoint}"
+
+METRIC_BUFFERS = (
+    'api_calls', 'errors', 'performance_samples', 'system_metrics', 'mode_toggles',
+    'device_commands', 'task_operations', 'workflow_operations', 'fallback_events'
+)
+
+class ApiCallRecord(NamedTuple):
+    timestamp: float
+    endpoint: str
+    method: str
+    success: bool
+    response_time_ms: float
+    status_code: int
+    error: Optional[str]
+
+class ErrorRecord(NamedTuple):
+    timestamp: float
+    type: str
+    details: str
+    severity: str
+
+class PerformanceSampleRecord(NamedTuple):
+    timestamp: float
+    metric: str
+    value: float
+    unit: str
+
+class SystemMetricsRecord(NamedTuple):
+    timestamp: float
+    cpu_percent: float
+    memory_percent: float
+    memory_mb: float
+
+class ModeToggleRecord(NamedTuple):
+    timestamp: float
+    from_mode: str
+    to_mode: str
+    success: bool
+    duration_ms: float
+
+class DeviceCommandRecord(NamedTuple):
+    timestamp: float
+    device_id: str
+    command: str
+    success: bool
+    duration_ms: float
+
+class TaskOperationRecord(NamedTuple):
+    timestamp: float
+    operation: str
+    task_id: str
+    success: bool
+    duration_ms: float
+
+class WorkflowOperationRecord(NamedTuple):
+    timestamp: float
+    operation: str
+    workflow_id: str
+    success: bool
+    duration_ms: float
+
+class FallbackEventRecord(NamedTuple):
+    timestamp: float
+    device_id: str
+    reason: str
+    recovery_time_ms: Optional[float]
+
+def record_to_dict(record: NamedTuple) -> Dict[str, Any]:
+    """Materialize a metric record as a report dict with an ISO timestamp"""
+    entry = record._asdict()
+    entry['timestamp'] = datetime.utcfromtimestamp(record.timestamp).isoformat()
+    return entry
 
 class BurnInMetrics:
     """Tracks comprehensive burn-in test metrics"""
     
     def __init__(self):
         self.start_time = datetime.utcnow()
-        self.api_calls = []
-        self.errors = []
-        self.performance_samples = []
-        self.system_metrics = []
-        self.mode_toggles = []
-        self.device_commands = []
-        self.task_operations = []
-        self.workflow_operations = []
-        self.fallback_events = []
-        self.lock = threading.Lock()
+        # Fixed-capacity ring buffers; deque appends are atomic, so recorders need no lock
+        self.api_calls = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.errors = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.performance_samples = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.system_metrics = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.mode_toggles = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.device_commands = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.task_operations = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.workflow_operations = deque(maxlen=METRIC_BUFFER_SIZE)
+        self.fallback_events = deque(maxlen=METRIC_BUFFER_SIZE)
+        
+        # Running aggregates per buffer, kept exact even after the ring buffers drop samples
+        self._counts = dict.fromkeys(METRIC_BUFFERS, 0)
+        self._success_counts = dict.fromkeys(METRIC_BUFFERS, 0)
+        self._duration_sums = dict.fromkeys(METRIC_BUFFERS, 0.0)
+        self._success_duration_sums = dict.fromkeys(METRIC_BUFFERS, 0.0)
+        self._critical_errors = 0
+        self._stats_lock = threading.Lock()
+        
+        # Every record is also streamed to a JSONL file by a background writer thread
+        # once the run starts; records are dropped (and counted) if the writer falls behind
+        self.records_path = RECORDS_PATH
+        self._records_queue = queue.Queue(maxsize=RECORDS_QUEUE_SIZE)
+        self._records_dropped = 0
+        self._writer = None
+    
+    def open_records(self):
+        """Open the JSONL sink and start the background writer"""
+        if self._writer is not None:
+            return
+        
+        self._writer = threading.Thread(
+            target=self._write_records, args=(open(self.records_path, 'wb'),),
+            name='burn-in-records', daemon=True
+        )
+        self._writer.start()
+    
+    def _write_records(self, sink):
+        """Drain queued records to the JSONL sink until the close sentinel arrives"""
+        with sink:
+            while True:
+                item = self._records_queue.get()
+                if item is None:
+                    break
+                buffer_name, entry = item
+                sink.write(encode_json({'metric': buffer_name, **record_to_dict(entry)}) + b'\n')
+    
+    def close(self):
+        """Flush outstanding records to the JSONL file and stop the writer"""
+        if self._writer is not None and self._writer.is_alive():
+            self._records_queue.put(None)
+            self._writer.join()
+    
+    def _record(self, buffer_name: str, entry: NamedTuple, success: bool = False, duration_ms: float = 0.0):
+        """Append an entry to a metric buffer and fold it into the running aggregates"""
+        getattr(self, buffer_name).append(entry)
+        dropped = False
+        if self._writer is not None:
+            try:
+                self._records_queue.put_nowait((buffer_name, entry))
+            except queue.Full:
+                dropped = True
+        with self._stats_lock:
+            self._records_dropped += dropped
+            self._counts[buffer_name] += 1
+            self._duration_sums[buffer_name] += duration_ms
+            if success:
+                self._success_counts[buffer_name] += 1
+                self._success_duration_sums[buffer_name] += duration_ms
     
     def record_api_call(self, endpoint: str, method: str, success: bool, response_time_ms: float, status_code: int, error: str = None):
         """Record API call metrics"""
-        with self.lock:
-            self.api_calls.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'endpoint': endpoint,
-                'method': method,
-                'success': success,
-                'response_time_ms': response_time_ms,
-                'status_code': status_code,
-                'error': error
-            })
+        self._record('api_calls', ApiCallRecord(
+            time.time(), endpoint, method, success, response_time_ms, status_code, error
+        ), success, response_time_ms)
     
     def record_error(self, error_type: str, details: str, severity: str = 'ERROR'):
         """Record error event"""
-        with self.lock:
-            self.errors.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': error_type,
-                'details': details,
-                'severity': severity
-            })
+        self._record('errors', ErrorRecord(
+            time.time(), error_type, details, severity
+        ))
+        if severity == 'CRITICAL':
+            with self._stats_lock:
+                self._critical_errors += 1
     
     def record_performance_sample(self, metric_name: str, value: float, unit: str = 'ms'):
         """Record performance metric sample"""
-        with self.lock:
-            self.performance_samples.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'metric': metric_name,
-                'value': value,
-                'unit': unit
-            })
+        self._record('performance_samples', PerformanceSampleRecord(
+            time.time(), metric_name, value, unit
+        ))
     
     def record_system_metrics(self, cpu_percent: float, memory_percent: float, memory_mb: float):
         """Record system resource metrics"""
-        with self.lock:
-            self.system_metrics.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory_percent,
-                'memory_mb': memory_mb
-            })
+        self._record('system_metrics', SystemMetricsRecord(
+            time.time(), cpu_percent, memory_percent, memory_mb
+        ))
     
     def record_mode_toggle(self, from_mode: str, to_mode: str, success: bool, duration_ms: float):
         """Record mode toggle operation"""
-        with self.lock:
-            self.mode_toggles.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'from_mode': from_mode,
-                'to_mode': to_mode,
-                'success': success,
-                'duration_ms': duration_ms
-            })
+        self._record('mode_toggles', ModeToggleRecord(
+            time.time(), from_mode, to_mode, success, duration_ms
+        ), success, duration_ms)
     
     def record_device_command(self, device_id: str, command: str, success: bool, duration_ms: float):
         """Record device command execution"""
-        with self.lock:
-            self.device_commands.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'device_id': device_id,
-                'command': command,
-                'success': success,
-                'duration_ms': duration_ms
-            })
+        self._record('device_commands', DeviceCommandRecord(
+            time.time(), device_id, command, success, duration_ms
+        ), success, duration_ms)
     
     def record_task_operation(self, operation: str, task_id: str, success: bool, duration_ms: float):
         """Record task operation"""
-        with self.lock:
-            self.task_operations.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'operation': operation,
-                'task_id': task_id,
-                'success': success,
-                'duration_ms': duration_ms
-            })
+        self._record('task_operations', TaskOperationRecord(
+            time.time(), operation, task_id, success, duration_ms
+        ), success, duration_ms)
     
     def record_workflow_operation(self, operation: str, workflow_id: str, success: bool, duration_ms: float):
         """Record workflow operation"""
-        with self.lock:
-            self.workflow_operations.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'operation': operation,
-                'workflow_id': workflow_id,
-                'success': success,
-                'duration_ms': duration_ms
-            })
+        self._record('workflow_operations', WorkflowOperationRecord(
+            time.time(), operation, workflow_id, success, duration_ms
+        ), success, duration_ms)
     
     def record_fallback_event(self, device_id: str, reason: str, recovery_time_ms: float = None):
         """Record fallback system activation"""
-        with self.lock:
-            self.fallback_events.append({
-                'timestamp': datetime.utcnow().isoformat(),
-                'device_id': device_id,
-                'reason': reason,
-                'recovery_time_ms': recovery_time_ms
-            })
+        self._record('fallback_events', FallbackEventRecord(
+            time.time(), device_id, reason, recovery_time_ms
+        ))
     
     def get_success_rate(self) -> float:
         """Calculate overall success rate"""
-        if not self.api_calls:
+        if not self._counts['api_calls']:
             return 0.0
         
-        successful_calls = sum(1 for call in self.api_calls if call['success'])
-        return (successful_calls / len(self.api_calls)) * 100.0
+        return (self._success_counts['api_calls'] / self._counts['api_calls']) * 100.0
     
     def get_average_response_time(self) -> float:
         """Calculate average API response time"""
-        if not self.api_calls:
+        if not self._counts['api_calls']:
             return 0.0
         
-        times = [call['response_time_ms'] for call in self.api_calls]
-        return statistics.mean(times)
+        return self._duration_sums['api_calls'] / self._counts['api_calls']
+    
+    def get_average_success_duration(self, buffer_name: str) -> Optional[float]:
+        """Calculate the mean duration of successful operations, or None if there were none"""
+        if not self._success_counts[buffer_name]:
+            return None
+        
+        return self._success_duration_sums[buffer_name] / self._success_counts[buffer_name]
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive burn-in test report"""
@@ -177,65 +292,110 @@ class BurnInMetrics:
                 'start_time': self.start_time.isoformat(),
                 'end_time': end_time.isoformat(),
                 'duration_hours': duration_hours,
-                'total_api_calls': len(self.api_calls),
-                'total_errors': len(self.errors),
+                'total_api_calls': self._counts['api_calls'],
+                'total_errors': self._counts['errors'],
+                'critical_errors': self._critical_errors,
                 'success_rate_percent': self.get_success_rate(),
                 'average_response_time_ms': self.get_average_response_time()
             },
             'performance_metrics': {
-                'mode_toggles': len(self.mode_toggles),
-                'device_commands': len(self.device_commands),
-                'task_operations': len(self.task_operations),
-                'workflow_operations': len(self.workflow_operations),
-                'fallback_events': len(self.fallback_events)
+                'mode_toggles': self._counts['mode_toggles'],
+                'device_commands': self._counts['device_commands'],
+                'task_operations': self._counts['task_operations'],
+                'workflow_operations': self._counts['workflow_operations'],
+                'fallback_events': self._counts['fallback_events'],
+                'avg_mode_toggle_ms': self.get_average_success_duration('mode_toggles'),
+                'avg_device_command_ms': self.get_average_success_duration('device_commands')
+            },
+            'buffer_usage': {
+                'records_file': self.records_path,
+                'records_dropped': self._records_dropped,
+                'capacity': METRIC_BUFFER_SIZE,
+                'retained': {name: len(getattr(self, name)) for name in METRIC_BUFFERS},
+                'overflow_discarded': {
+                    name: self._counts[name] - len(getattr(self, name)) for name in METRIC_BUFFERS
+                }
             },
             'detailed_metrics': {
-                'api_calls': self.api_calls,
-                'errors': self.errors,
-                'performance_samples': self.performance_samples,
-                'system_metrics': self.system_metrics,
-                'mode_toggles': self.mode_toggles,
-                'device_commands': self.device_commands,
-                'task_operations': self.task_operations,
-                'workflow_operations': self.workflow_operations,
-                'fallback_events': self.fallback_events
+                name: [record_to_dict(record) for record in list(getattr(self, name))]
+                for name in METRIC_BUFFERS
             }
         }
 
 class BurnInTester:
     """Main burn-in test orchestrator"""
     
+    # Device command -> (HTTP method, endpoint template)
+    DEVICE_COMMAND_ENDPOINTS = {
+        'refresh': ('GET', '/devices/%s/status'),
+        'toggle-mode': ('POST', '/devices/%s/toggle-mode'),
+        'initialize': ('POST', '/devices/%s/initialize'),
+    }
+    DEVICE_COMMANDS = tuple(DEVICE_COMMAND_ENDPOINTS)
+    TASK_OPERATIONS = ('create', 'cancel', 'queue_status')
+    TASK_PRIORITIES = ('low', 'normal', 'high')
+    WORKFLOW_OPERATIONS = ('create_template', 'deploy', 'status')
+    
     def __init__(self):
         self.metrics = BurnInMetrics()
         self.running = False
-        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix='burn-in')
         self.current_mode = 'safe'  # Track current system mode
-        self.test_devices = ['mock_device_001', 'mock_device_002', 'mock_device_003']
+        self.test_devices = ('mock_device_001', 'mock_device_002', 'mock_device_003')
+        
+        # Cycle test table, bound once rather than rebuilt every cycle
+        self.test_functions = (
+            ('metrics_refresh', self.test_metrics_refresh),
+            ('mode_toggle', self.test_mode_toggle),
+            ('device_commands', self.test_device_commands),
+            ('bulk_tasks', self.test_bulk_task_operations),
+            ('workflows', self.test_workflow_operations),
+            ('device_recovery', self.simulate_device_offline_recovery)
+        )
+        self.tests_per_cycle = max(1, round(len(self.test_functions) * 0.7))
+        
+        # Keep-alive connection pool sized to the worker count, shared by every request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-    def make_api_request(self, method: str, endpoint: str, data: Dict = None, timeout: int = 30) -> Tuple[bool, Dict, float, int, str]:
-        """Make API request and record metrics"""
-        url = f"{API_BASE_URL}{endpoint}"
-        start_time = time.time()
+        # Workflow list reused by deploy operations until it is older than the TTL
+        self._workflow_cache = (None, 0.0)
+        self._workflow_ttl = 60.0
+        
+        # Prime psutil's CPU baseline so monitoring can sample without blocking
+        psutil.cpu_percent(interval=None)
+        
+    def make_api_request(self, method: str, endpoint: str, data: Dict = None, timeout: int = 30,
+                         parse_body: bool = True) -> Tuple[bool, Optional[Dict], float, int, str]:
+        """Make API request and record metrics
+        
+        With parse_body=False a successful response body is not decoded and None is
+        returned in its place; error responses are still parsed for their detail.
+        """
+        url = api_url(endpoint)
+        start_ns = time.monotonic_ns()
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, timeout=timeout)
-            elif method.upper() == 'POST':
-                response = requests.post(url, json=data, timeout=timeout)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, timeout=timeout)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, timeout=timeout)
-            else:
+            if method.upper() not in ('GET', 'POST', 'PUT', 'DELETE'):
                 raise ValueError(f"Unsupported method: {method}")
             
-            response_time_ms = (time.time() - start_time) * 1000
+            if data is None:
+                response = self.session.request(method.upper(), url, timeout=timeout)
+            else:
+                response = self.session.request(method.upper(), url, data=encode_json(data), headers=JSON_HEADERS, timeout=timeout)
+            
+            response_time_ms = (time.monotonic_ns() - start_ns) * 1e-6
             success = response.status_code < 400
             
-            try:
-                response_data = response.json()
-            except:
-                response_data = {'raw_response': response.text}
+            if success and not parse_body:
+                response_data = None
+            else:
+                try:
+                    response_data = parse_json(response)
+                except:
+                    response_data = {'raw_response': response.text}
             
             error_msg = None if success else response_data.get('detail', f'HTTP {response.status_code}')
             
@@ -244,7 +404,7 @@ class BurnInTester:
             return success, response_data, response_time_ms, response.status_code, error_msg
             
         except Exception as e:
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.monotonic_ns() - start_ns) * 1e-6
             error_msg = str(e)
             
             self.metrics.record_api_call(endpoint, method, False, response_time_ms, 0, error_msg)
@@ -252,17 +412,23 @@ class BurnInTester:
             
             return False, {}, response_time_ms, 0, error_msg
     
+    def check_sla(self, operation: str, response_time: float, description: str, *args):
+        """Record a performance violation, formatting the warning only when the SLA is breached"""
+        threshold = PERFORMANCE_SLA_MS[operation]
+        if response_time > threshold:
+            self.metrics.record_error(
+                'PERFORMANCE_VIOLATION',
+                '%s took %sms (target: ≤%sms)' % (description % args, response_time, threshold),
+                'WARNING'
+            )
+    
     def test_metrics_refresh(self):
         """Test dashboard metrics refresh performance"""
-        start_time = time.time()
-        success, data, response_time, status_code, error = self.make_api_request('GET', '/dashboard/stats')
+        success, data, response_time, status_code, error = self.make_api_request('GET', '/dashboard/stats', parse_body=False)
         
         if success:
             self.metrics.record_performance_sample('metrics_refresh', response_time, 'ms')
-            
-            # Validate metrics refresh target (≤ 5s)
-            if response_time > 5000:
-                self.metrics.record_error('PERFORMANCE_VIOLATION', f'Metrics refresh took {response_time}ms (target: ≤5000ms)', 'WARNING')
+            self.check_sla('metrics_refresh', response_time, 'Metrics refresh')
                 
         return success
     
@@ -270,17 +436,13 @@ class BurnInTester:
         """Test Safe↔Live mode toggle performance"""
         new_mode = 'live_mode' if self.current_mode == 'safe' else 'safe_mode'
         
-        start_time = time.time()
-        success, data, response_time, status_code, error = self.make_api_request('POST', '/system/mode/set', {'mode': new_mode})
+        success, data, response_time, status_code, error = self.make_api_request('POST', '/system/mode/set', {'mode': new_mode}, parse_body=False)
         
         if success:
             old_mode = self.current_mode
             self.current_mode = 'live' if new_mode == 'live_mode' else 'safe'
             self.metrics.record_mode_toggle(old_mode, self.current_mode, True, response_time)
-            
-            # Validate mode toggle target (< 1s)
-            if response_time > 1000:
-                self.metrics.record_error('PERFORMANCE_VIOLATION', f'Mode toggle took {response_time}ms (target: <1000ms)', 'WARNING')
+            self.check_sla('mode_toggle', response_time, 'Mode toggle')
         else:
             self.metrics.record_mode_toggle(self.current_mode, new_mode, False, response_time)
             
@@ -289,50 +451,37 @@ class BurnInTester:
     def test_device_commands(self):
         """Test device command execution performance"""
         device_id = random.choice(self.test_devices)
-        commands = ['refresh', 'toggle-mode', 'initialize']
-        command = random.choice(commands)
-        
-        start_time = time.time()
+        command = random.choice(self.DEVICE_COMMANDS)
         
-        if command == 'refresh':
-            success, data, response_time, status_code, error = self.make_api_request('GET', f'/devices/{device_id}/status')
-        elif command == 'toggle-mode':
-            success, data, response_time, status_code, error = self.make_api_request('POST', f'/devices/{device_id}/toggle-mode')
-        elif command == 'initialize':
-            success, data, response_time, status_code, error = self.make_api_request('POST', f'/devices/{device_id}/initialize')
+        method, endpoint_template = self.DEVICE_COMMAND_ENDPOINTS[command]
+        success, data, response_time, status_code, error = self.make_api_request(method, endpoint_template % device_id, parse_body=False)
         
         self.metrics.record_device_command(device_id, command, success, response_time)
-        
-        # Validate device command target (< 2s)
-        if response_time > 2000:
-            self.metrics.record_error('PERFORMANCE_VIOLATION', f'Device command {command} took {response_time}ms (target: <2000ms)', 'WARNING')
+        self.check_sla('device_command', response_time, 'Device command %s', command)
             
         return success
     
     def test_bulk_task_operations(self):
         """Test bulk task creation and management"""
-        operations = ['create', 'cancel', 'queue_status']
-        operation = random.choice(operations)
-        
-        start_time = time.time()
+        operation = random.choice(self.TASK_OPERATIONS)
         
         if operation == 'create':
             task_data = {
                 'device_id': random.choice(self.test_devices),
                 'target_username': f'burn_in_user_{random.randint(1000, 9999)}',
                 'actions': ['search_user', 'view_profile'],
-                'priority': random.choice(['low', 'normal', 'high'])
+                'priority': random.choice(self.TASK_PRIORITIES)
             }
             success, data, response_time, status_code, error = self.make_api_request('POST', '/tasks/create-device-bound', task_data)
             task_id = data.get('task_id', 'unknown') if success else 'failed'
             
         elif operation == 'cancel':
             # Simulate task cancellation
-            success, data, response_time, status_code, error = self.make_api_request('GET', '/tasks/active')
+            success, data, response_time, status_code, error = self.make_api_request('GET', '/tasks/active', parse_body=False)
             task_id = 'simulated_cancel'
             
         elif operation == 'queue_status':
-            success, data, response_time, status_code, error = self.make_api_request('GET', '/devices/queues/all')
+            success, data, response_time, status_code, error = self.make_api_request('GET', '/devices/queues/all', parse_body=False)
             task_id = 'queue_check'
         
         self.metrics.record_task_operation(operation, task_id, success, response_time)
@@ -340,10 +489,7 @@ class BurnInTester:
     
     def test_workflow_operations(self):
         """Test workflow creation and deployment"""
-        operations = ['create_template', 'deploy', 'status']
-        operation = random.choice(operations)
-        
-        start_time = time.time()
+        operation = random.choice(self.WORKFLOW_OPERATIONS)
         
         if operation == 'create_template':
             template_data = {
@@ -359,11 +505,11 @@ class BurnInTester:
             
         elif operation == 'deploy':
             # First get available workflows
-            success_list, data_list, _, _, _ = self.make_api_request('GET', '/workflows')
-            if success_list and data_list.get('workflows'):
-                workflow_id = random.choice(data_list['workflows']).get('template_id', 'unknown')
+            workflows = self._get_workflows()
+            if workflows:
+                workflow_id = random.choice(workflows).get('template_id', 'unknown')
                 deploy_data = {'device_ids': [random.choice(self.test_devices)]}
-                success, data, response_time, status_code, error = self.make_api_request('POST', f'/workflows/{workflow_id}/deploy', deploy_data)
+                success, data, response_time, status_code, error = self.make_api_request('POST', f'/workflows/{workflow_id}/deploy', deploy_data, parse_body=False)
             else:
                 success = False
                 response_time = 0
@@ -372,10 +518,24 @@ class BurnInTester:
         elif operation == 'status':
             success, data, response_time, status_code, error = self.make_api_request('GET', '/workflows')
             workflow_id = 'status_check'
+            if success:
+                self._workflow_cache = (data.get('workflows', []), time.monotonic())
         
         self.metrics.record_workflow_operation(operation, workflow_id, success, response_time)
         return success
     
+    def _get_workflows(self) -> List[Dict]:
+        """Return the available workflows, refetching once the cached list is stale"""
+        now = time.monotonic()
+        workflows, fetched_at = self._workflow_cache
+        if workflows is None or now - fetched_at > self._workflow_ttl:
+            success, data, _, _, _ = self.make_api_request('GET', '/workflows')
+            if not success:
+                return []
+            workflows = data.get('workflows', [])
+            self._workflow_cache = (workflows, now)
+        return workflows
+    
     def simulate_device_offline_recovery(self):
         """Simulate device offline scenarios and recovery"""
         device_id = random.choice(self.test_devices)
@@ -384,20 +544,18 @@ class BurnInTester:
         self.metrics.record_fallback_event(device_id, 'Simulated device offline for burn-in test')
         
         # Test fallback system by trying to execute task on "offline" device
-        start_time = time.time()
-        success, data, response_time, status_code, error = self.make_api_request('GET', f'/devices/{device_id}/queue')
+        success, data, response_time, status_code, error = self.make_api_request('GET', f'/devices/{device_id}/queue', parse_body=False)
         
-        # Simulate recovery
-        recovery_time = time.time() - start_time
+        # Simulate recovery; recovery time is the probe request's own monotonic latency
         if success:
-            self.metrics.record_fallback_event(device_id, 'Device recovered', recovery_time * 1000)
+            self.metrics.record_fallback_event(device_id, 'Device recovered', response_time)
         
         return success
     
     def monitor_system_resources(self):
         """Monitor system CPU and memory usage"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)  # usage since the previous sample
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
             memory_mb = memory.used / (1024 * 1024)
@@ -416,30 +574,28 @@ class BurnInTester:
     
     def run_test_cycle(self):
         """Run one complete test cycle"""
-        test_functions = [
-            ('metrics_refresh', self.test_metrics_refresh),
-            ('mode_toggle', self.test_mode_toggle),
-            ('device_commands', self.test_device_commands),
-            ('bulk_tasks', self.test_bulk_task_operations),
-            ('workflows', self.test_workflow_operations),
-            ('device_recovery', self.simulate_device_offline_recovery)
-        ]
+        # Run a random 70% of tests each cycle: varied mix, constant load
+        plan = random.sample(self.test_functions, self.tests_per_cycle)
         
         # Submit concurrent tests
-        futures = []
-        for test_name, test_func in test_functions:
-            if random.random() > 0.3:  # Run ~70% of tests each cycle for varied load
-                future = self.executor.submit(test_func)
-                futures.append((test_name, future))
-        
-        # Wait for completion and handle results
-        for test_name, future in futures:
-            try:
-                result = future.result(timeout=30)
-                logger.info(f"Test cycle {test_name}: {'SUCCESS' if result else 'FAILED'}")
-            except Exception as e:
-                logger.error(f"Test cycle {test_name} exception: {str(e)}")
-                self.metrics.record_error('TEST_EXCEPTION', f'{test_name}: {str(e)}')
+        submit = self.executor.submit
+        futures = {submit(test_func): test_name for test_name, test_func in plan}
+        
+        # Handle results in completion order so stragglers are visible early
+        try:
+            for future in as_completed(futures, timeout=30):
+                test_name = futures[future]
+                try:
+                    result = future.result()
+                    logger.info(f"Test cycle {test_name}: {'SUCCESS' if result else 'FAILED'}")
+                except Exception as e:
+                    logger.error(f"Test cycle {test_name} exception: {str(e)}")
+                    self.metrics.record_error('TEST_EXCEPTION', f'{test_name}: {str(e)}')
+        except FuturesTimeoutError:
+            for future, test_name in futures.items():
+                if not future.done():
+                    logger.error(f"Test cycle {test_name} exception: timed out after 30s")
+                    self.metrics.record_error('TEST_EXCEPTION', f'{test_name}: timed out after 30s')
     
     def run_burn_in_test(self):
         """Run the complete 2-hour burn-in test"""
@@ -448,14 +604,16 @@ class BurnInTester:
         logger.info(f"Backend URL: {BACKEND_URL}")
         
         self.running = True
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = start_time + (BURN_IN_DURATION_HOURS * 3600)
         
         cycle_count = 0
         
         try:
-            while self.running and time.time() < end_time:
-                cycle_start = time.time()
+            self.metrics.open_records()
+            
+            while self.running and time.monotonic() < end_time:
+                cycle_start = time.monotonic()
                 
                 # Run test cycle
                 logger.info(f"Running test cycle {cycle_count + 1}")
@@ -467,7 +625,7 @@ class BurnInTester:
                 cycle_count += 1
                 
                 # Calculate remaining time
-                remaining_hours = (end_time - time.time()) / 3600
+                remaining_hours = (end_time - time.monotonic()) / 3600
                 logger.info(f"Cycle {cycle_count} completed. Remaining time: {remaining_hours:.2f} hours")
                 
                 # Progress update every 10 cycles
@@ -477,7 +635,7 @@ class BurnInTester:
                     logger.info(f"Progress update - Success rate: {success_rate:.1f}%, Avg response: {avg_response:.1f}ms")
                 
                 # Wait for next cycle
-                cycle_duration = time.time() - cycle_start
+                cycle_duration = time.monotonic() - cycle_start
                 sleep_time = max(0, TEST_INTERVAL_SECONDS - cycle_duration)
                 if sleep_time > 0:
                     time.sleep(sleep_time)
@@ -490,6 +648,8 @@ class BurnInTester:
             self.metrics.record_error('BURN_IN_FATAL', f'Test stopped due to exception: {str(e)}', 'CRITICAL')
         finally:
             self.executor.shutdown(wait=True)
+            self.session.close()
+            self.metrics.close()
             
         logger.info(f"Burn-in test completed after {cycle_count} cycles")
         
@@ -511,27 +671,24 @@ class BurnInTester:
             failures.append(f"Average response time {avg_response:.1f}ms > 5000ms requirement")
         
         # Check mode toggle performance
-        mode_toggles = [t for t in report['detailed_metrics']['mode_toggles'] if t['success']]
-        if mode_toggles:
-            avg_mode_toggle_time = statistics.mean([t['duration_ms'] for t in mode_toggles])
-            if avg_mode_toggle_time > 1000:
-                failures.append(f"Average mode toggle time {avg_mode_toggle_time:.1f}ms > 1000ms requirement")
+        avg_mode_toggle_time = report['performance_metrics']['avg_mode_toggle_ms']
+        if avg_mode_toggle_time is not None:
+            if avg_mode_toggle_time > PERFORMANCE_SLA_MS['mode_toggle']:
+                failures.append(f"Average mode toggle time {avg_mode_toggle_time:.1f}ms > {PERFORMANCE_SLA_MS['mode_toggle']}ms requirement")
         
         # Check device command performance
-        device_commands = [c for c in report['detailed_metrics']['device_commands'] if c['success']]
-        if device_commands:
-            avg_device_cmd_time = statistics.mean([c['duration_ms'] for c in device_commands])
-            if avg_device_cmd_time > 2000:
-                failures.append(f"Average device command time {avg_device_cmd_time:.1f}ms > 2000ms requirement")
+        avg_device_cmd_time = report['performance_metrics']['avg_device_command_ms']
+        if avg_device_cmd_time is not None:
+            if avg_device_cmd_time > PERFORMANCE_SLA_MS['device_command']:
+                failures.append(f"Average device command time {avg_device_cmd_time:.1f}ms > {PERFORMANCE_SLA_MS['device_command']}ms requirement")
         
         # Check for critical errors
-        critical_errors = [e for e in report['detailed_metrics']['errors'] if e['severity'] == 'CRITICAL']
+        critical_errors = report['test_summary']['critical_errors']
         if critical_errors:
-            failures.append(f"Found {len(critical_errors)} critical errors")
+            failures.append(f"Found {critical_errors} critical errors")
         
         # Check fallback system activation
-        fallback_events = report['detailed_metrics']['fallback_events']
-        if len(fallback_events) == 0:
+        if report['performance_metrics']['fallback_events'] == 0:
             failures.append("No fallback system activations detected (expected during device offline simulation)")
         
         return len(failures) == 0, failures
@@ -552,8 +709,12 @@ def main():
     
     # Save detailed report
     report_filename = f'/tmp/burn_in_report_{int(time.time())}.json'
-    with open(report_filename, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(report_filename, 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_filename, 'w') as f:
+            json.dump(report, f, indent=2)
     
     # Evaluate success criteria
     success, failures = tester.evaluate_success_criteria(report)
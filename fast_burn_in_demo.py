@@ -12,14 +12,21 @@ import time
 import threading
 import psutil
 import logging
+from array import array
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
 import statistics
 import random
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,12 +44,34 @@ DEMO_DURATION_MINUTES = 10  # 10 minutes for demo
 TEST_INTERVAL_SECONDS = 2   # Test every 2 seconds for intensity
 MAX_CONCURRENT_REQUESTS = 30
 
+def latency_summary(response_times: Sequence[float]) -> Tuple[float, float, float]:
+    """Return the mean, p95 and p99 of a non-empty list of response times"""
+    if np is not None:
+        times = np.asarray(response_times, dtype=np.float64)
+        p95, p99 = np.percentile(times, (95, 99))
+        return float(times.mean()), float(p95), float(p99)
+    
+    if len(response_times) == 1:
+        return response_times[0], response_times[0], response_times[0]
+    # 'inclusive' interpolates between ranks the same way as numpy.percentile
+    cuts = statistics.quantiles(response_times, n=100, method='inclusive')
+    return statistics.mean(response_times), cuts[94], cuts[98]
+
+def mean_successful_time(records: List[Dict[str, Any]]) -> float:
+    """Return the mean response time of the successful records, or 0 if there are none"""
+    if np is not None:
+        times = np.fromiter((r['response_time_ms'] for r in records), dtype=np.float64, count=len(records))
+        successes = np.fromiter((r['success'] for r in records), dtype=np.bool_, count=len(records))
+        return float(times[successes].mean()) if successes.any() else 0
+    
+    times = [r['response_time_ms'] for r in records if r['success']]
+    return statistics.mean(times) if times else 0
+
 class FastBurnInTester:
     """Fast-track burn-in tester for demonstration"""
     
     def __init__(self):
         self.metrics = {
-            'api_calls': [],
             'errors': [],
             'mode_toggles': [],
             'device_commands': [],
@@ -53,6 +82,20 @@ class FastBurnInTester:
         self.current_mode = 'safe'
         self.start_time = datetime.utcnow()
         self.lock = threading.Lock()
+        
+        # API calls stored as struct-of-arrays columns, one entry per call
+        self._api_response_times = array('d')
+        self._api_successes = array('B')
+        
+        # Per-thread pending API calls, appended without locking and merged once per cycle
+        self._local = threading.local()
+        self._pending_api_calls: List[List[Tuple[bool, float]]] = []
+        
+        # Keep-alive connection pool shared by all worker threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_CONCURRENT_REQUESTS, pool_block=False)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def make_api_request(self, method: str, endpoint: str, data: Dict = None) -> Tuple[bool, float, int]:
         """Make API request and record metrics"""
@@ -60,38 +103,23 @@ class FastBurnInTester:
         start_time = time.time()
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, timeout=10)
-            elif method.upper() == 'POST':
-                response = requests.post(url, json=data, timeout=10)
+            if method.upper() == 'POST':
+                response = self.session.post(url, json=data, timeout=10)
             else:
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=10)
             
             response_time_ms = (time.time() - start_time) * 1000
             success = response.status_code < 400
             
-            with self.lock:
-                self.metrics['api_calls'].append({
-                    'endpoint': endpoint,
-                    'method': method,
-                    'success': success,
-                    'response_time_ms': response_time_ms,
-                    'status_code': response.status_code
-                })
+            self._api_call_buffer().append((success, response_time_ms))
             
             return success, response_time_ms, response.status_code
             
         except Exception as e:
             response_time_ms = (time.time() - start_time) * 1000
             
+            self._api_call_buffer().append((False, response_time_ms))
             with self.lock:
-                self.metrics['api_calls'].append({
-                    'endpoint': endpoint,
-                    'method': method,
-                    'success': False,
-                    'response_time_ms': response_time_ms,
-                    'status_code': 0
-                })
                 self.metrics['errors'].append({
                     'endpoint': endpoint,
                     'error': str(e),
@@ -100,6 +128,25 @@ class FastBurnInTester:
             
             return False, response_time_ms, 0
     
+    def _api_call_buffer(self) -> List[Tuple[bool, float]]:
+        """Return this thread's pending API call buffer, registering it on first use"""
+        buffer = getattr(self._local, 'api_calls', None)
+        if buffer is None:
+            buffer = self._local.api_calls = []
+            with self.lock:
+                self._pending_api_calls.append(buffer)
+        return buffer
+    
+    def _merge_api_calls(self):
+        """Move pending per-thread API calls into the shared columns"""
+        with self.lock:
+            for buffer in self._pending_api_calls:
+                calls = buffer[:]
+                del buffer[:len(calls)]  # calls appended meanwhile stay pending
+                for success, response_time_ms in calls:
+                    self._api_response_times.append(response_time_ms)
+                    self._api_successes.append(success)
+    
     def test_metrics_refresh(self):
         """Test dashboard metrics refresh"""
         success, response_time, status_code = self.make_api_request('GET', '/dashboard/stats')
@@ -190,35 +237,43 @@ class FastBurnInTester:
             except Exception as e:
                 results.append((False, 0))
         
+        self._merge_api_calls()
         return results
     
     def calculate_performance_metrics(self):
         """Calculate key performance metrics"""
-        if not self.metrics['api_calls']:
+        # Snapshot the columns and lists; worker threads may still be recording
+        self._merge_api_calls()
+        with self.lock:
+            response_times = self._api_response_times[:]
+            successes = self._api_successes[:]
+            mode_toggles = list(self.metrics['mode_toggles'])
+            device_commands = list(self.metrics['device_commands'])
+        
+        if not response_times:
             return {}
         
         # Calculate success rate
-        successful_calls = sum(1 for call in self.metrics['api_calls'] if call['success'])
-        success_rate = (successful_calls / len(self.metrics['api_calls'])) * 100.0
-        
-        # Calculate average response time
-        response_times = [call['response_time_ms'] for call in self.metrics['api_calls']]
-        avg_response_time = statistics.mean(response_times)
+        if np is not None:
+            success_rate = float(np.frombuffer(successes, dtype=np.uint8).mean()) * 100.0
+        else:
+            success_rate = (sum(successes) / len(successes)) * 100.0
         
-        # Calculate mode toggle performance
-        mode_toggle_times = [t['response_time_ms'] for t in self.metrics['mode_toggles'] if t['success']]
-        avg_mode_toggle_time = statistics.mean(mode_toggle_times) if mode_toggle_times else 0
+        # Calculate response time mean and tail latencies
+        avg_response_time, p95_response_time, p99_response_time = latency_summary(response_times)
         
-        # Calculate device command performance
-        device_cmd_times = [c['response_time_ms'] for c in self.metrics['device_commands'] if c['success']]
-        avg_device_cmd_time = statistics.mean(device_cmd_times) if device_cmd_times else 0
+        # Calculate mode toggle and device command performance
+        avg_mode_toggle_time = mean_successful_time(mode_toggles)
+        avg_device_cmd_time = mean_successful_time(device_commands)
         
         return {
             'success_rate_percent': success_rate,
             'average_response_time_ms': avg_response_time,
+            'p95_response_time_ms': p95_response_time,
+            'p99_response_time_ms': p99_response_time,
             'average_mode_toggle_time_ms': avg_mode_toggle_time,
             'average_device_command_time_ms': avg_device_cmd_time,
-            'total_api_calls': len(self.metrics['api_calls']),
+            'total_api_calls': len(response_times),
             'total_errors': len(self.metrics['errors']),
             'mode_toggles_performed': len(self.metrics['mode_toggles']),
             'device_commands_performed': len(self.metrics['device_commands'])
@@ -269,6 +324,7 @@ class FastBurnInTester:
             logger.error(f"Fast burn-in demo failed: {str(e)}")
         finally:
             self.executor.shutdown(wait=True)
+            self.session.close()
             
         logger.info(f"Fast burn-in demo completed after {cycle_count} cycles")
         return self.calculate_performance_metrics()
@@ -319,6 +375,7 @@ def main():
     print(f"Total API Calls: {metrics['total_api_calls']}")
     print(f"Success Rate: {metrics['success_rate_percent']:.2f}%")
     print(f"Average Response Time: {metrics['average_response_time_ms']:.2f}ms")
+    print(f"P95 / P99 Response Time: {metrics['p95_response_time_ms']:.2f}ms / {metrics['p99_response_time_ms']:.2f}ms")
     print(f"Average Mode Toggle Time: {metrics['average_mode_toggle_time_ms']:.2f}ms")
     print(f"Average Device Command Time: {metrics['average_device_command_time_ms']:.2f}ms")
     print(f"Mode Toggles Performed: {metrics['mode_toggles_performed']}")
@@ -6,6 +6,8 @@ Usage: python admin_cli.py --help
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 from datetime import datetime, timezone
@@ -15,10 +17,22 @@ from typing import Optional
 class LicenseAdminClient:
     def __init__(self, base_url: str, admin_token: str):
         self.base_url = base_url.rstrip("/")
-        self.headers = {
+        
+        # One keep-alive session for every call; idempotent requests are
+        # retried briefly on connection errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
             "Authorization": f"Bearer {admin_token}",
             "Content-Type": "application/json"
-        }
+        })
+    
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
     
     def issue_license(
         self,
@@ -42,7 +56,7 @@ class LicenseAdminClient:
             "grace_days": grace_days
         }
         
-        response = requests.post(f"{self.base_url}/auth/issue", headers=self.headers, json=data)
+        response = self.session.post(f"{self.base_url}/auth/issue", json=data)
         response.raise_for_status()
         return response.json()
     
@@ -53,13 +67,13 @@ class LicenseAdminClient:
             "reason": reason
         }
         
-        response = requests.post(f"{self.base_url}/auth/revoke", headers=self.headers, json=data)
+        response = self.session.post(f"{self.base_url}/auth/revoke", json=data)
         response.raise_for_status()
         return response.json()
     
     def list_licenses(self):
         """List all licenses"""
-        response = requests.get(f"{self.base_url}/admin/licenses", headers=self.headers)
+        response = self.session.get(f"{self.base_url}/admin/licenses")
         response.raise_for_status()
         return response.json()
     
@@ -70,7 +84,7 @@ class LicenseAdminClient:
             "additional_days": additional_days
         }
         
-        response = requests.post(f"{self.base_url}/admin/extend", headers=self.headers, params=params)
+        response = self.session.post(f"{self.base_url}/admin/extend", params=params)
         response.raise_for_status()
         return response.json()
     
@@ -80,7 +94,7 @@ class LicenseAdminClient:
         if device_id:
             params["device_id"] = device_id
         
-        response = requests.get(f"{self.base_url}/auth/verify", params=params)
+        response = self.session.get(f"{self.base_url}/auth/verify", params=params)
         response.raise_for_status()
         return response.json()
 
@@ -95,7 +109,10 @@ def cli(ctx, url, token):
         token = os.environ.get("LICENSE_ADMIN_TOKEN", "admin-token-change-this")
     
     ctx.ensure_object(dict)
-    ctx.obj["client"] = LicenseAdminClient(url, token)
+    client = LicenseAdminClient(url, token)
+    ctx.obj["client"] = client
+    # Release the pooled connections once the subcommand has finished
+    ctx.call_on_close(client.close)
 
 
 @cli.command()
@@ -1,20 +1,45 @@
 import json
+import threading
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
 from pathlib import Path
 
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 from .models import License, LicenseResponse, VerifyResponse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value):
+    """Serialize datetimes for the stdlib JSON fallback"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class LicenseService:
     def __init__(self, secret_key: str = None, storage_path: str = "licenses.json"):
         self.secret_key = secret_key or os.environ.get("LICENSE_SECRET_KEY", "your-secret-key-change-this")
         self.storage_path = storage_path
         self.algorithm = "HS256"
+        # HMAC key built once and reused for every token signed or verified
+        self._signing_key = jwk.construct(self.secret_key, self.algorithm)
+        
+        # Short-lived cache of verify results, keyed on (license_key, device_id)
+        self._verify_cache: Dict[Tuple[str, Optional[str]], Tuple[float, VerifyResponse]] = {}
+        self._verify_cache_ttl = 5
+        self._verify_cache_max = 1024
+        
+        # Licenses are held in memory; storage is read once here and written on every mutation
+        self._lock = threading.RLock()
         self._ensure_storage()
+        self._licenses: Dict[str, License] = self._load_licenses()
     
     def _ensure_storage(self):
         """Create storage file if it doesn't exist"""
@@ -24,28 +49,33 @@ class LicenseService:
     def _load_licenses(self) -> Dict[str, License]:
         """Load licenses from storage"""
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
-                return {
-                    license_id: License(**license_data)
-                    for license_id, license_data in data.items()
-                }
+            if orjson is not None:
+                with open(self.storage_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.storage_path, 'r') as f:
+                    data = json.load(f)
+            return {
+                license_id: License(**license_data)
+                for license_id, license_data in data.items()
+            }
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
     
     def _save_licenses(self, licenses: Dict[str, License]):
         """Save licenses to storage"""
-        serializable_data = {}
-        for license_id, license_obj in licenses.items():
-            license_dict = license_obj.dict()
-            # Convert datetime objects to ISO format strings
-            for key, value in license_dict.items():
-                if isinstance(value, datetime):
-                    license_dict[key] = value.isoformat()
-            serializable_data[license_id] = license_dict
+        # Datetimes are written as ISO strings by orjson natively, or by _json_default
+        serializable_data = {
+            license_id: license_obj.dict()
+            for license_id, license_obj in licenses.items()
+        }
         
-        with open(self.storage_path, 'w') as f:
-            json.dump(serializable_data, f, indent=2)
+        if orjson is not None:
+            with open(self.storage_path, 'wb') as f:
+                f.write(orjson.dumps(serializable_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.storage_path, 'w') as f:
+                json.dump(serializable_data, f, indent=2, default=_json_default)
     
     def issue_license(
         self,
@@ -57,6 +87,41 @@ class LicenseService:
         grace_days: int = 7
     ) -> LicenseResponse:
         """Issue a new license"""
+        return self.issue_licenses([dict(
+            customer_id=customer_id,
+            plan=plan,
+            features=features,
+            device_id=device_id,
+            duration_days=duration_days,
+            grace_days=grace_days
+        )])[0]
+    
+    def issue_licenses(self, specs: List[Dict]) -> List[LicenseResponse]:
+        """Issue several licenses with a single storage write
+        
+        Each spec takes the same keyword arguments as issue_license.
+        """
+        responses = []
+        with self._lock:
+            for spec in specs:
+                license_obj, response = self._new_license(**spec)
+                self._licenses[license_obj.id] = license_obj
+                responses.append(response)
+            
+            # Save to storage
+            self._save_licenses(self._licenses)
+        return responses
+    
+    def _new_license(
+        self,
+        customer_id: str,
+        plan: str = "basic",
+        features: List[str] = None,
+        device_id: Optional[str] = None,
+        duration_days: int = 30,
+        grace_days: int = 7
+    ) -> Tuple[License, LicenseResponse]:
+        """Build a license record and its signed key without touching storage"""
         if features is None:
             features = ["basic_automation"]
         
@@ -77,11 +142,6 @@ class LicenseService:
             is_active=True
         )
         
-        # Save to storage
-        licenses = self._load_licenses()
-        licenses[license_id] = license_obj
-        self._save_licenses(licenses)
-        
         # Generate JWT token
         payload = {
             "sub": customer_id,
@@ -94,9 +154,9 @@ class LicenseService:
             "grace_days": grace_days
         }
         
-        license_key = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        license_key = jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         
-        return LicenseResponse(
+        return license_obj, LicenseResponse(
             license_key=license_key,
             customer_id=customer_id,
             plan=plan,
@@ -105,11 +165,39 @@ class LicenseService:
             grace_days=grace_days
         )
     
+    def _decode(self, license_key: str) -> Dict:
+        """Decode a license token without checking expiry, so licenses in grace still decode"""
+        return jwt.decode(license_key, self._signing_key, algorithms=[self.algorithm],
+                          options={"verify_exp": False})
+    
     def verify_license(self, license_key: str, device_id: Optional[str] = None) -> VerifyResponse:
-        """Verify a license key"""
+        """Verify a license key, serving repeated checks from a short TTL cache"""
+        cache_key = (license_key, device_id)
+        cached = self._verify_cache.get(cache_key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        response = self._verify_license_uncached(license_key, device_id)
+        
+        # Never cache a valid result past the point its expiry or grace state changes
+        cache_until = now + self._verify_cache_ttl
+        if response.valid and response.expires_at:
+            boundary = response.expires_at
+            if response.in_grace_period:
+                boundary += timedelta(days=response.grace_days)
+            cache_until = min(cache_until, now + (boundary - datetime.now(timezone.utc)).total_seconds())
+        
+        if len(self._verify_cache) >= self._verify_cache_max:
+            self._verify_cache.clear()
+        self._verify_cache[cache_key] = (cache_until, response)
+        return response
+    
+    def _verify_license_uncached(self, license_key: str, device_id: Optional[str] = None) -> VerifyResponse:
+        """Verify a license key against storage"""
         try:
-            # Decode JWT
-            payload = jwt.decode(license_key, self.secret_key, algorithms=[self.algorithm])
+            # Decode JWT; expiry is checked below so the grace period applies
+            payload = self._decode(license_key)
             
             license_id = payload.get("license_id")
             customer_id = payload.get("sub")
@@ -125,9 +213,9 @@ class LicenseService:
                     message="Invalid license format"
                 )
             
-            # Load license from storage
-            licenses = self._load_licenses()
-            license_obj = licenses.get(license_id)
+            # Look up the in-memory license record
+            with self._lock:
+                license_obj = self._licenses.get(license_id)
             
             if not license_obj:
                 return VerifyResponse(
@@ -190,20 +278,21 @@ class LicenseService:
     def revoke_license(self, license_key: str, reason: str = "Revoked by admin") -> bool:
         """Revoke a license"""
         try:
-            payload = jwt.decode(license_key, self.secret_key, algorithms=[self.algorithm])
+            payload = self._decode(license_key)
             license_id = payload.get("license_id")
             
             if not license_id:
                 return False
             
-            licenses = self._load_licenses()
-            license_obj = licenses.get(license_id)
-            
-            if license_obj:
-                license_obj.is_active = False
-                license_obj.revoked_at = datetime.now(timezone.utc)
-                self._save_licenses(licenses)
-                return True
+            with self._lock:
+                license_obj = self._licenses.get(license_id)
+                
+                if license_obj:
+                    license_obj.is_active = False
+                    license_obj.revoked_at = datetime.now(timezone.utc)
+                    self._save_licenses(self._licenses)
+                    self._verify_cache.clear()
+                    return True
             
             return False
             
@@ -212,25 +301,26 @@ class LicenseService:
     
     def list_licenses(self) -> List[License]:
         """List all licenses"""
-        licenses = self._load_licenses()
-        return list(licenses.values())
+        with self._lock:
+            return list(self._licenses.values())
     
     def extend_license(self, license_key: str, additional_days: int) -> bool:
         """Extend a license by additional days"""
         try:
-            payload = jwt.decode(license_key, self.secret_key, algorithms=[self.algorithm])
+            payload = self._decode(license_key)
             license_id = payload.get("license_id")
             
             if not license_id:
                 return False
             
-            licenses = self._load_licenses()
-            license_obj = licenses.get(license_id)
-            
-            if license_obj and license_obj.is_active:
-                license_obj.expires_at += timedelta(days=additional_days)
-                self._save_licenses(licenses)
-                return True
+            with self._lock:
+                license_obj = self._licenses.get(license_id)
+                
+                if license_obj and license_obj.is_active:
+                    license_obj.expires_at += timedelta(days=additional_days)
+                    self._save_licenses(self._licenses)
+                    self._verify_cache.clear()
+                    return True
             
             return False
             
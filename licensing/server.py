@@ -41,10 +41,13 @@ def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     return credentials
 
 
+SERVICE_NAME = "iOS Instagram Automation License Server"
+
+
 @app.get("/")
 async def root():
     return {
-        "service": "iOS Instagram Automation License Server",
+        "service": SERVICE_NAME,
         "version": "1.0.0",
         "status": "running"
     }
@@ -145,5 +148,30 @@ async def extend_license(
 
 
 if __name__ == "__main__":
+    import json
+    import sys
+    import urllib.request
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
\ No newline at end of file
+    
+    # Reuse an instance that is already listening, but only when its root
+    # endpoint confirms it is this license server. Anything else holding the
+    # port is left to uvicorn's bind error, which exits non-zero.
+    try:
+        with urllib.request.urlopen("http://127.0.0.1:8002/", timeout=0.5) as response:
+            already_running = json.load(response).get("service") == SERVICE_NAME
+    except (OSError, ValueError, AttributeError):
+        already_running = False
+    
+    if already_running:
+        print("License server already running on port 8002")
+        sys.exit(0)
+    
+    # loop/http "auto" pick uvloop and httptools when installed
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8002,
+        loop="auto",
+        http="auto",
+        access_log=os.environ.get("LICENSE_ACCESS_LOG", "false").lower() == "true"
+    )
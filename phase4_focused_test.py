@@ -10,6 +10,7 @@ import sys
 import time
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
 
 # Get backend URL from environment
@@ -23,6 +24,12 @@ class Phase4FocusedTester:
         self.test_results = []
         self.created_templates = []
         
+        # Pooled keep-alive session shared by every request
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
     def log_test_result(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test result"""
         result = {
@@ -43,13 +50,13 @@ class Phase4FocusedTester:
             url = f"{API_BASE_URL}{endpoint}"
             
             if method.upper() == "GET":
-                response = requests.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params, timeout=30)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, params=params, timeout=30)
+                response = self.http.post(url, json=data, params=params, timeout=30)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, params=params, timeout=30)
+                response = self.http.put(url, json=data, params=params, timeout=30)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, params=params, timeout=30)
+                response = self.http.delete(url, params=params, timeout=30)
             else:
                 return False, {"error": f"Unsupported method: {method}"}, 400
             
@@ -452,19 +459,22 @@ class Phase4FocusedTester:
         print("🚀 Starting Phase 4 Live Device Integration Focused Testing")
         print("=" * 80)
         
-        # Run test categories
-        self.test_dual_mode_system_core()
-        self.test_live_device_endpoints()
-        self.test_live_task_execution()
-        self.test_workflow_system_integration()
-        self.test_device_management_features()
-        self.test_fallback_system()
-        self.test_operation_confirmation()
-        self.test_integration_compatibility()
-        self.test_performance_and_stability()
-        
-        # Generate summary
-        return self.generate_test_summary()
+        try:
+            # Run test categories
+            self.test_dual_mode_system_core()
+            self.test_live_device_endpoints()
+            self.test_live_task_execution()
+            self.test_workflow_system_integration()
+            self.test_device_management_features()
+            self.test_fallback_system()
+            self.test_operation_confirmation()
+            self.test_integration_compatibility()
+            self.test_performance_and_stability()
+            
+            # Generate summary
+            return self.generate_test_summary()
+        finally:
+            self.http.close()
     
     def generate_test_summary(self):
         """Generate comprehensive test summary"""
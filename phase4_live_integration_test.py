@@ -12,6 +12,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
 
 # Get backend URL from environment
@@ -27,6 +28,12 @@ class Phase4LiveIntegrationTester:
         self.test_device_ids = ["test_device_001", "test_device_002"]
         self.test_template_id = None
         
+        # Pooled keep-alive session shared by every request
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
     def log_test_result(self, test_name: str, success: bool, details: str = "", error: str = ""):
         """Log test result"""
         result = {
@@ -47,13 +54,13 @@ class Phase4LiveIntegrationTester:
             url = f"{API_BASE_URL}{endpoint}"
             
             if method.upper() == "GET":
-                response = requests.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params, timeout=30)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, params=params, timeout=30)
+                response = self.http.post(url, json=data, params=params, timeout=30)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, params=params, timeout=30)
+                response = self.http.put(url, json=data, params=params, timeout=30)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, params=params, timeout=30)
+                response = self.http.delete(url, params=params, timeout=30)
             else:
                 return False, {"error": f"Unsupported method: {method}"}, 400
             
@@ -862,6 +869,8 @@ class Phase4LiveIntegrationTester:
                 print(f"✅ Cleaned up test workflow template: {self.test_template_id}")
             else:
                 print(f"⚠️ Failed to clean up test workflow template: {self.test_template_id}")
+        
+        self.http.close()
 
 if __name__ == "__main__":
     print("Phase 4 Live Device Integration Backend Test Suite")
@@ -10,9 +10,18 @@ import os
 import sys
 from datetime import datetime, timedelta
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add backend directory to Python path
 sys.path.append('/app/backend')
 
+# This script issues small sequential queries; a small pool is plenty
+os.environ.setdefault('MONGO_MAX_POOL_SIZE', '4')
+os.environ.setdefault('MONGO_MIN_POOL_SIZE', '1')
+
 from ios_automation.database_models import get_db_manager, init_database, InteractionEvent, LatestInteraction
 from ios_automation.deduplication_service import get_deduplication_service
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -123,11 +132,7 @@ async def seed_test_data():
         ]
         
         # Insert test events
-        events_inserted = 0
-        for event in test_events:
-            success = await db_manager.record_interaction_event(event)
-            if success:
-                events_inserted += 1
+        events_inserted = await db_manager.record_interaction_events(test_events)
         
         logger.info(f"✅ Inserted {events_inserted} test interaction events")
         
@@ -150,11 +155,8 @@ async def seed_test_data():
         ]
         
         # Insert latest interaction records
-        latest_inserted = 0
-        for interaction in latest_interactions:
-            success = await db_manager.upsert_latest_interaction(interaction)
-            if success:
-                latest_inserted += 1
+        success = await db_manager.bulk_upsert_latest_interactions(latest_interactions)
+        latest_inserted = len(latest_interactions) if success else 0
         
         logger.info(f"✅ Inserted {latest_inserted} deduplication records")
         
@@ -184,6 +186,14 @@ async def seed_test_data():
         logger.error(f"❌ Failed to seed test data: {e}")
         return False
 
+def _plan_stages(plan: dict) -> list:
+    """Flatten the stage names of a query plan tree"""
+    stages = [plan.get("stage")]
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child:
+            stages.extend(_plan_stages(child))
+    return stages
+
 async def verify_database_setup():
     """Verify the database setup is working correctly"""
     logger.info("Verifying database setup...")
@@ -194,6 +204,25 @@ async def verify_database_setup():
         # Test database connectivity
         await db_manager.ensure_indexes()
         
+        # Verify the hot lookups are served by an index scan
+        index_checks = {
+            "dedupe lookup": db_manager.interactions_latest.find({
+                "account_id": "device_test_001",
+                "target_username": "test_user_1",
+                "action": "follow"
+            }),
+            "account events": db_manager.interactions_events.find(
+                {"account_id": "device_test_001"}
+            ).sort("ts", -1).limit(5)
+        }
+        for query_name, cursor in index_checks.items():
+            plan = await cursor.explain()
+            stages = _plan_stages(plan["queryPlanner"]["winningPlan"])
+            if "IXSCAN" in stages and "COLLSCAN" not in stages:
+                logger.info(f"✅ {query_name} uses index scan")
+            else:
+                logger.warning(f"⚠️ {query_name} not index-backed: {stages}")
+        
         # Test interaction event retrieval
         events = await db_manager.get_interaction_events(limit=5)
         logger.info(f"✅ Retrieved {len(events)} interaction events")
@@ -229,7 +258,11 @@ async def cleanup_test_data():
             logger.error("MONGO_URL environment variable not set")
             return False
         
-        client = AsyncIOMotorClient(mongo_url)
+        client = AsyncIOMotorClient(
+            mongo_url,
+            maxPoolSize=int(os.environ['MONGO_MAX_POOL_SIZE']),
+            minPoolSize=int(os.environ['MONGO_MIN_POOL_SIZE'])
+        )
         db = client[os.environ.get('DB_NAME', 'instagram_automation')]
         
         # Remove test interaction events
@@ -294,4 +327,7 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # uvloop cuts per-await overhead for the many small DB round-trips above
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
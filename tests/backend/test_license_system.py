@@ -2,29 +2,81 @@
 Test cases for Phase 5 SaaS Licensing & Kill-Switch system
 """
 import asyncio
+import importlib.util
 import pytest
 import sys
 import os
+import re
+import time
 from datetime import datetime, timezone, timedelta
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../licensing'))
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '../../backend')
+
+
+def load_backend_module(name: str):
+    """Load a backend module by file path once, without extending sys.path"""
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(BACKEND_DIR, f"{name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
 
-from license_client import LicenseClient, LicenseStatus
 from licensing.license_service import LicenseService
 from licensing.models import LicenseResponse, VerifyResponse
 
+# Keep test license storage on tmpfs where available
+TEST_STORAGE_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
+# Classifies verify messages by the first outcome keyword they contain
+MESSAGE_KIND = re.compile(r"invalid license token|revoked|expired|grace period|device", re.I)
+
+
+def message_kind(message: str):
+    """Return the outcome keyword of a verify message, lower-cased"""
+    match = MESSAGE_KIND.search(message)
+    return match.group().lower() if match else None
+
+
+def wait_until_expired(issued: LicenseResponse, timeout: float = 5.0):
+    """Poll until an issued license's expiry time is in the past"""
+    deadline = time.monotonic() + timeout
+    while datetime.now(timezone.utc) <= issued.expires_at:
+        assert time.monotonic() < deadline, "license did not expire in time"
+        time.sleep(0.001)
+
 
 class TestLicenseService:
     """Test cases for the LicenseService backend"""
     
-    def setup_method(self):
-        """Set up test environment"""
-        self.license_service = LicenseService(
+    # Licenses used by the verification tests, issued together in setup_class
+    FIXTURES = {
+        "verify": dict(customer_id="test-verify", duration_days=30),
+        "revoke": dict(customer_id="test-revoke", duration_days=30),
+        "expire": dict(customer_id="test-expire", duration_days=0, grace_days=0),  # Expires immediately
+        "grace": dict(customer_id="test-grace", duration_days=0, grace_days=1),  # Expires immediately, 1 day grace
+        # Expired a day ago, still inside a 2 day grace; the token's exp claim is already past
+        "grace-revoke": dict(customer_id="test-grace-revoke", duration_days=-1, grace_days=2),
+        "grace-extend": dict(customer_id="test-grace-extend", duration_days=-1, grace_days=2),
+    }
+    
+    @classmethod
+    def setup_class(cls):
+        """Set up one license service shared by every test in the class"""
+        cls.license_service = LicenseService(
             secret_key="test-secret-key",
-            storage_path="/tmp/test_licenses.json"
+            storage_path=os.path.join(TEST_STORAGE_DIR, "test_licenses.json")
         )
+        cls.fixtures = dict(zip(
+            cls.FIXTURES,
+            cls.license_service.issue_licenses(list(cls.FIXTURES.values()))
+        ))
     
     def test_issue_license(self):
         """Test license issuance"""
@@ -44,11 +96,7 @@ class TestLicenseService:
     
     def test_verify_valid_license(self):
         """Test verification of a valid license"""
-        # Issue a license first
-        issued = self.license_service.issue_license(
-            customer_id="test-verify",
-            duration_days=30
-        )
+        issued = self.fixtures["verify"]
         
         # Verify it
         response = self.license_service.verify_license(issued.license_key)
@@ -64,15 +112,11 @@ class TestLicenseService:
         
         assert isinstance(response, VerifyResponse)
         assert response.valid is False
-        assert "Invalid license token" in response.message
+        assert message_kind(response.message) == "invalid license token"
     
     def test_revoke_license(self):
         """Test license revocation"""
-        # Issue a license first
-        issued = self.license_service.issue_license(
-            customer_id="test-revoke",
-            duration_days=30
-        )
+        issued = self.fixtures["revoke"]
         
         # Verify it's valid
         verify_response = self.license_service.verify_license(issued.license_key)
@@ -85,59 +129,70 @@ class TestLicenseService:
         # Verify it's now invalid
         verify_response = self.license_service.verify_license(issued.license_key)
         assert verify_response.valid is False
-        assert "revoked" in verify_response.message.lower()
+        assert message_kind(verify_response.message) == "revoked"
     
     def test_expired_license(self):
         """Test verification of expired license (simulate by short duration)"""
-        import time
+        issued = self.fixtures["expire"]
         
-        # Issue a license with very short duration
-        issued = self.license_service.issue_license(
-            customer_id="test-expire",
-            duration_days=0,  # Expires immediately
-            grace_days=0
-        )
-        
-        # Wait a bit to ensure expiry
-        time.sleep(1)
+        # Wait only until the expiry instant has passed
+        wait_until_expired(issued)
         
         # Verify it's expired
         response = self.license_service.verify_license(issued.license_key)
         assert response.valid is False
-        assert "expired" in response.message.lower()
+        assert message_kind(response.message) == "expired"
     
     def test_grace_period(self):
         """Test license grace period functionality"""
-        import time
-        
-        # Issue a license with very short duration but grace period
-        issued = self.license_service.issue_license(
-            customer_id="test-grace",
-            duration_days=0,  # Expires immediately
-            grace_days=1  # 1 day grace
-        )
+        issued = self.fixtures["grace"]
         
-        # Wait a bit to ensure expiry but within grace
-        time.sleep(1)
+        # Wait only until the expiry instant has passed; grace still applies
+        wait_until_expired(issued)
         
         # Should still be valid due to grace period
         response = self.license_service.verify_license(issued.license_key)
         assert response.valid is True
         assert response.in_grace_period is True
-        assert "grace period" in response.message.lower()
+        assert message_kind(response.message) == "grace period"
+    
+    def test_revoke_and_extend_in_grace_period(self):
+        """Test that licenses in their grace period can still be revoked and extended"""
+        revoked = self.fixtures["grace-revoke"]
+        extended = self.fixtures["grace-extend"]
+        
+        assert self.license_service.verify_license(revoked.license_key).in_grace_period is True
+        assert self.license_service.revoke_license(revoked.license_key) is True
+        response = self.license_service.verify_license(revoked.license_key)
+        assert response.valid is False
+        assert message_kind(response.message) == "revoked"
+        
+        assert self.license_service.verify_license(extended.license_key).in_grace_period is True
+        assert self.license_service.extend_license(extended.license_key, 30) is True
+        stored = {lic.customer_id: lic for lic in self.license_service.list_licenses()}
+        assert stored["test-grace-extend"].expires_at == extended.expires_at + timedelta(days=30)
 
 
 class TestLicenseClient:
     """Test cases for the LicenseClient integration"""
     
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
+        """Load the backend license client module for the class"""
+        cls.client_module = load_backend_module("license_client")
+    
+    @pytest.fixture(autouse=True)
+    def client_env(self, monkeypatch):
+        """Give every test a fresh client; monkeypatch restores the environment"""
+        self.setup_client(monkeypatch)
+    
+    def setup_client(self, monkeypatch):
         """Set up test environment"""
-        # Mock environment variables
-        os.environ["LICENSE_KEY"] = ""  # Start with no license
-        os.environ["LICENSE_API_URL"] = "http://localhost:8002"
-        os.environ["LICENSE_VERIFY_INTERVAL"] = "60"  # 1 minute for testing
+        monkeypatch.setenv("LICENSE_KEY", "")  # Start with no license
+        monkeypatch.setenv("LICENSE_API_URL", "http://localhost:8002")
+        monkeypatch.setenv("LICENSE_VERIFY_INTERVAL", "60")  # 1 minute for testing
         
-        self.license_client = LicenseClient()
+        self.license_client = self.client_module.LicenseClient()
     
     @pytest.mark.asyncio
     async def test_no_license_startup(self):
@@ -153,10 +208,10 @@ class TestLicenseClient:
         await self.license_client.stop()
     
     @pytest.mark.asyncio
-    async def test_invalid_license_startup(self):
+    async def test_invalid_license_startup(self, monkeypatch):
         """Test client behavior with invalid license key"""
-        os.environ["LICENSE_KEY"] = "invalid-license-key"
-        client = LicenseClient()
+        monkeypatch.setenv("LICENSE_KEY", "invalid-license-key")
+        client = self.client_module.LicenseClient()
         
         await client.start()
         
@@ -164,18 +219,15 @@ class TestLicenseClient:
         assert client.is_licensed() is False
         
         status = client.get_status()
-        assert status["status"] == LicenseStatus.LOCKED
+        assert status["status"] == self.client_module.LicenseStatus.LOCKED
         assert status["licensed"] is False
         
         await client.stop()
-        
-        # Clean up
-        os.environ["LICENSE_KEY"] = ""
     
     def test_device_id_generation(self):
         """Test device ID generation and persistence"""
-        client1 = LicenseClient()
-        client2 = LicenseClient()
+        client1 = self.client_module.LicenseClient()
+        client2 = self.client_module.LicenseClient()
         
         # Both clients should get the same device ID (persisted)
         assert client1.device_id == client2.device_id
@@ -189,63 +241,69 @@ def run_license_tests():
     # Test LicenseService
     print("\n📋 Testing LicenseService...")
     service_test = TestLicenseService()
+    service_test.setup_class()
     
     try:
-        service_test.setup_method()
         service_test.test_issue_license()
         print("✅ License issuance: PASS")
     except Exception as e:
         print(f"❌ License issuance: FAIL - {e}")
     
     try:
-        service_test.setup_method()
         service_test.test_verify_valid_license()
         print("✅ Valid license verification: PASS")
     except Exception as e:
         print(f"❌ Valid license verification: FAIL - {e}")
     
     try:
-        service_test.setup_method()
         service_test.test_verify_invalid_license()
         print("✅ Invalid license verification: PASS")
     except Exception as e:
         print(f"❌ Invalid license verification: FAIL - {e}")
     
     try:
-        service_test.setup_method()
         service_test.test_revoke_license()
         print("✅ License revocation: PASS")
     except Exception as e:
         print(f"❌ License revocation: FAIL - {e}")
     
     try:
-        service_test.setup_method()
         service_test.test_grace_period()
         print("✅ Grace period functionality: PASS")
     except Exception as e:
         print(f"❌ Grace period functionality: FAIL - {e}")
     
+    try:
+        service_test.test_revoke_and_extend_in_grace_period()
+        print("✅ Revoke/extend in grace period: PASS")
+    except Exception as e:
+        print(f"❌ Revoke/extend in grace period: FAIL - {e}")
+    
     # Test LicenseClient
     print("\n🔗 Testing LicenseClient...")
     client_test = TestLicenseClient()
+    client_test.setup_class()
     
     try:
-        client_test.setup_method()
-        asyncio.run(client_test.test_no_license_startup())
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            client_test.setup_client(monkeypatch)
+            asyncio.run(client_test.test_no_license_startup())
         print("✅ No license startup: PASS")
     except Exception as e:
         print(f"❌ No license startup: FAIL - {e}")
     
     try:
-        client_test.setup_method()
-        asyncio.run(client_test.test_invalid_license_startup())
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            client_test.setup_client(monkeypatch)
+            asyncio.run(client_test.test_invalid_license_startup(monkeypatch))
         print("✅ Invalid license handling: PASS")
     except Exception as e:
         print(f"❌ Invalid license handling: FAIL - {e}")
     
     try:
-        client_test.setup_method()
-        client_test.test_device_id_generation()
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            client_test.setup_client(monkeypatch)
+            client_test.test_device_id_generation()
         print("✅ Device ID generation: PASS")
     except Exception as e:
         print(f"❌ Device ID generation: FAIL - {e}")
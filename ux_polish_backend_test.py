@@ -20,10 +20,39 @@ from typing import Dict, List, Any
 import requests
 import uuid
 
+from backend_test_utils import JSON_HEADERS, encode_json, orjson, parse_json
+
 # Get backend URL from environment
 BACKEND_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://4ef408ef-8dbe-4893-ba4f-68a32b4f29f2.preview.emergentagent.com')
 API_BASE_URL = f"{BACKEND_URL}/api"
 
+_iso_second_cache = [None, ""]
+
+def iso_now() -> str:
+    """UTC ISO timestamp; the date/time prefix is formatted once per second"""
+    now = time.time()
+    second = int(now)
+    if second != _iso_second_cache[0]:
+        _iso_second_cache[0] = second
+        _iso_second_cache[1] = datetime.utcfromtimestamp(second).isoformat()
+    return f"{_iso_second_cache[1]}.{int((now - second) * 1e6):06d}"
+
+# Fixed invalid request bodies, serialized once at import time
+INVALID_TEMPLATE_BODY = encode_json({
+    "name": "",  # Empty name should fail
+    "template_type": "engagement",
+    "target_pages": [],  # Empty pages should fail
+    "comment_list": []   # Empty comments should fail
+})
+
+INVALID_TASK_BODY = encode_json({
+    "device_id": "",  # Empty device ID
+    "target_username": "",  # Empty username
+    "actions": [],  # Empty actions
+    "max_likes": -1,  # Invalid value
+    "max_follows": 2  # Invalid value
+})
+
 class UXPolishBackendTester:
     """Comprehensive tester for UX polish backend integration"""
     
@@ -50,12 +79,13 @@ class UXPolishBackendTester:
         
     def log_test_result(self, test_name: str, success: bool, details: str = "", error: str = "", performance_ms: int = None):
         """Log test result with optional performance metrics"""
+        timestamp = iso_now()
         result = {
             "test_name": test_name,
             "success": success,
             "details": details,
             "error": error,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "performance_ms": performance_ms
         }
         self.test_results.append(result)
@@ -64,7 +94,7 @@ class UXPolishBackendTester:
             self.performance_metrics.append({
                 "endpoint": test_name,
                 "response_time_ms": performance_ms,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             })
         
         status = "✅" if success else "❌"
@@ -90,7 +120,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 
                 # Validate required fields for StatusStrip
                 required_fields = ['system_stats', 'device_status', 'queue_status', 'active_tasks']
@@ -119,7 +149,7 @@ class UXPolishBackendTester:
         try:
             response = requests.get(f"{API_BASE_URL}/dashboard/stats", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 device_status = data.get('device_status', {})
                 
                 # Check for StatusStrip required fields
@@ -146,7 +176,7 @@ class UXPolishBackendTester:
         try:
             response = requests.get(f"{API_BASE_URL}/dashboard/stats", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 queue_status = data.get('queue_status', {})
                 
                 if 'total_tasks' in queue_status:
@@ -175,7 +205,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'safe_mode_status' in data:
                     safe_mode_status = data['safe_mode_status']
                     
@@ -211,8 +241,8 @@ class UXPolishBackendTester:
             dashboard_response = requests.get(f"{API_BASE_URL}/dashboard/stats", timeout=10)
             
             if safe_mode_response.status_code == 200 and dashboard_response.status_code == 200:
-                safe_mode_data = safe_mode_response.json()
-                dashboard_data = dashboard_response.json()
+                safe_mode_data = parse_json(safe_mode_response)
+                dashboard_data = parse_json(dashboard_response)
                 
                 safe_mode_direct = safe_mode_data.get('safe_mode_status', {}).get('safe_mode', False)
                 safe_mode_dashboard = dashboard_data.get('safe_mode_status', {}).get('safe_mode', False)
@@ -240,7 +270,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'device_queues' in data:
                     device_queues = data['device_queues']
                     statistics = data.get('statistics', {})
@@ -267,7 +297,7 @@ class UXPolishBackendTester:
             response = requests.get(f"{API_BASE_URL}/devices/{device_id}/queue", timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'queue_snapshot' in data:
                     snapshot = data['queue_snapshot']
                     
@@ -316,7 +346,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and data.get('template_id'):
                     template_id = data['template_id']
                     self.created_templates.append(template_id)
@@ -359,7 +389,7 @@ class UXPolishBackendTester:
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json(response)
                     if data.get('success'):
                         # Validate ActionFeedback deployment response
                         feedback_fields = ['success', 'deployment_summary', 'created_tasks']
@@ -413,7 +443,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and data.get('task_id'):
                     task_id = data['task_id']
                     self.created_tasks.append(task_id)
@@ -458,7 +488,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('task_id') and data.get('status'):
                     # Validate traditional task feedback structure
                     feedback_fields = ['task_id', 'status', 'message']
@@ -485,22 +515,15 @@ class UXPolishBackendTester:
         
         # Test 1: Invalid workflow template creation
         try:
-            invalid_template = {
-                "name": "",  # Empty name should fail
-                "template_type": "engagement",
-                "target_pages": [],  # Empty pages should fail
-                "comment_list": []   # Empty comments should fail
-            }
-            
             response, perf_ms = self.measure_performance(
                 requests.post, f"{API_BASE_URL}/workflows", 
-                json=invalid_template, timeout=10
+                data=INVALID_TEMPLATE_BODY, headers=JSON_HEADERS, timeout=10
             )
             
             if response.status_code >= 400:
                 # Check if error response has proper structure for ActionFeedback
                 try:
-                    data = response.json()
+                    data = parse_json(response)
                     if 'detail' in data or 'message' in data:
                         self.log_test_result("Error Response Structure", True, 
                             "Error response has proper structure for ActionFeedback", performance_ms=perf_ms)
@@ -518,20 +541,12 @@ class UXPolishBackendTester:
         
         # Test 2: Invalid device-bound task creation
         try:
-            invalid_task = {
-                "device_id": "",  # Empty device ID
-                "target_username": "",  # Empty username
-                "actions": [],  # Empty actions
-                "max_likes": -1,  # Invalid value
-                "max_follows": 2  # Invalid value
-            }
-            
             response = requests.post(f"{API_BASE_URL}/tasks/create-device-bound", 
-                                   json=invalid_task, timeout=10)
+                                   data=INVALID_TASK_BODY, headers=JSON_HEADERS, timeout=10)
             
             if response.status_code >= 400:
                 try:
-                    data = response.json()
+                    data = parse_json(response)
                     if 'detail' in data:
                         self.log_test_result("Task Error Handling", True, 
                             "Invalid task properly rejected with error details")
@@ -559,7 +574,7 @@ class UXPolishBackendTester:
             
             if response.status_code == 404:
                 try:
-                    data = response.json()
+                    data = parse_json(response)
                     if 'detail' in data:
                         self.log_test_result("Deployment Error Handling", True, 
                             "Non-existent template properly rejected with 404")
@@ -586,7 +601,7 @@ class UXPolishBackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and 'settings' in data:
                     settings = data['settings']
                     
@@ -611,7 +626,7 @@ class UXPolishBackendTester:
         try:
             response = requests.get(f"{API_BASE_URL}/workflows", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('success') and isinstance(data.get('templates'), list):
                     templates = data['templates']
                     
@@ -705,7 +720,7 @@ class UXPolishBackendTester:
         try:
             response = requests.get(f"{API_BASE_URL}/system/safe-mode", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 safe_mode_status = data.get('safe_mode_status', {})
                 
                 # Check for consistent mock data fields
@@ -730,7 +745,7 @@ class UXPolishBackendTester:
         try:
             response = requests.get(f"{API_BASE_URL}/devices/queues/all", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 device_queues = data.get('device_queues', {})
                 
                 # Check if mock devices have consistent data structure
@@ -785,9 +800,32 @@ class UXPolishBackendTester:
         print("\n📋 UX Polish Backend Integration Test Report")
         print("=" * 80)
         
+        # Test summary categories
+        categories = {
+            "Dashboard & StatusStrip": ["Dashboard Stats API", "Device Status Structure", "Queue Status Structure"],
+            "Safe Mode Integration": ["Safe Mode Status API", "Safe Mode Consistency"],
+            "QueueInsights": ["Device Queues API", "Device Queue ETA"],
+            "ActionFeedback": ["Workflow Creation Feedback", "Workflow Deployment Feedback", "Task Creation Feedback", "Traditional Task Feedback"],
+            "Error Handling": ["Error Response Structure", "Task Error Handling", "Deployment Error Handling"],
+            "Session Management": ["Settings for Session", "Workflow Session Data"],
+            "Performance": ["Dashboard Performance", "Queue Insights Performance", "Workflow Performance"],
+            "Mock Data": ["Mock Data Structure", "Mock Device Data Consistency"]
+        }
+        category_of_test = {name: category for category, names in categories.items() for name in names}
+        
+        # Single pass: partition results and tally per-category counts
+        passed, failed = [], []
+        category_counts = {category: [0, 0] for category in categories}
+        for result in self.test_results:
+            (passed if result['success'] else failed).append(result)
+            counts = category_counts.get(category_of_test.get(result['test_name']))
+            if counts is not None:
+                counts[0] += result['success']
+                counts[1] += 1
+        
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['success'])
-        failed_tests = total_tests - passed_tests
+        passed_tests = len(passed)
+        failed_tests = len(failed)
         
         print(f"Total Tests: {total_tests}")
         print(f"Passed: {passed_tests}")
@@ -801,35 +839,19 @@ class UXPolishBackendTester:
         
         if failed_tests > 0:
             print("\n❌ Failed Tests:")
-            for result in self.test_results:
-                if not result['success']:
-                    print(f"  - {result['test_name']}: {result['error']}")
+            print("\n".join(f"  - {r['test_name']}: {r['error']}" for r in failed))
         
         print("\n✅ Passed Tests:")
-        for result in self.test_results:
-            if result['success']:
-                perf_info = f" ({result['performance_ms']}ms)" if result.get('performance_ms') else ""
-                print(f"  - {result['test_name']}: {result['details']}{perf_info}")
-        
-        # Test summary by category
-        categories = {
-            "Dashboard & StatusStrip": ["Dashboard Stats API", "Device Status Structure", "Queue Status Structure"],
-            "Safe Mode Integration": ["Safe Mode Status API", "Safe Mode Consistency"],
-            "QueueInsights": ["Device Queues API", "Device Queue ETA"],
-            "ActionFeedback": ["Workflow Creation Feedback", "Workflow Deployment Feedback", "Task Creation Feedback", "Traditional Task Feedback"],
-            "Error Handling": ["Error Response Structure", "Task Error Handling", "Deployment Error Handling"],
-            "Session Management": ["Settings for Session", "Workflow Session Data"],
-            "Performance": ["Dashboard Performance", "Queue Insights Performance", "Workflow Performance"],
-            "Mock Data": ["Mock Data Structure", "Mock Device Data Consistency"]
-        }
+        if passed:
+            print("\n".join(
+                f"  - {r['test_name']}: {r['details']}" + (f" ({r['performance_ms']}ms)" if r.get('performance_ms') else "")
+                for r in passed
+            ))
         
         print("\n📊 Test Results by Category:")
-        for category, test_names in categories.items():
-            category_results = [r for r in self.test_results if r['test_name'] in test_names]
-            if category_results:
-                passed = sum(1 for r in category_results if r['success'])
-                total = len(category_results)
-                print(f"  {category}: {passed}/{total} ({(passed/total*100):.0f}%)")
+        for category, (category_passed, category_total) in category_counts.items():
+            if category_total:
+                print(f"  {category}: {category_passed}/{category_total} ({(category_passed/category_total*100):.0f}%)")
         
         return {
             "total_tests": total_tests,
@@ -872,8 +894,12 @@ def main():
     report = tester.generate_test_report()
     
     # Save detailed report to file
-    with open('/app/ux_polish_backend_test_report.json', 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    if orjson is not None:
+        with open('/app/ux_polish_backend_test_report.json', 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open('/app/ux_polish_backend_test_report.json', 'w') as f:
+            json.dump(report, f, indent=2, default=str)
     
     print(f"\n📄 Detailed test report saved to: /app/ux_polish_backend_test_report.json")
     